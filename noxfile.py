@@ -66,6 +66,12 @@ def test_unit(session):
         "tests/test_core_context.py",
         "tests/test_core_platform.py",
         "tests/test_utils_rez_detector.py",
+        "tests/test_utils_config_utils.py",
+        "tests/test_web_detector.py",
+        "-n",
+        "auto",
+        "--dist",
+        "loadfile",
         "--cov=src/rez_proxy",
         "--cov-report=term-missing",
         "-v",
@@ -94,6 +100,8 @@ def test_routers(session):
     session.run(
         "pytest",
         "tests/test_routers_*.py",
+        "-n",
+        "auto",
         "--cov=src/rez_proxy/routers",
         "--cov-report=term-missing",
         "-v",
@@ -75,6 +75,10 @@ class RezProxyConfig(BaseSettings):
     api_prefix: str = Field(default="/api/v1", description="API prefix path")
     docs_url: str = Field(default="/docs", description="Documentation URL")
     redoc_url: str = Field(default="/redoc", description="ReDoc URL")
+    validate_responses: bool = Field(
+        default=True,
+        description="Validate endpoint responses against their response models",
+    )
 
     # Security configuration
     api_key: str | None = Field(default=None, description="API key for authentication")
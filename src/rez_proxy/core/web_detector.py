@@ -15,6 +15,63 @@ from rez_proxy.models.schemas import ServiceMode
 
 logger = logging.getLogger(__name__)
 
+_FORCE_LOCAL_KEYS = frozenset(("REZ_PROXY_FORCE_LOCAL",))
+
+_WEB_ENV_KEYS = frozenset(
+    (
+        # Explicit web environment markers
+        "REZ_PROXY_WEB_MODE",
+        "WEB_ENVIRONMENT",
+        "IS_WEB_ENV",
+        # Common web server environment variables
+        "SERVER_SOFTWARE",
+        "REQUEST_METHOD",
+        "HTTP_HOST",
+        "SCRIPT_NAME",
+        # Cloud/container platform indicators
+        "VERCEL",
+        "NETLIFY",
+        "HEROKU_APP_NAME",
+        "AWS_LAMBDA_FUNCTION_NAME",
+        "GOOGLE_CLOUD_PROJECT",
+        "AZURE_FUNCTIONS_ENVIRONMENT",
+        # Container orchestration
+        "KUBERNETES_SERVICE_HOST",
+        "DOCKER_CONTAINER",
+    )
+)
+
+_CONTAINER_MARKER_PATHS = (
+    # Docker
+    "/.dockerenv",
+    # Kubernetes
+    "/var/run/secrets/kubernetes.io",
+    # Other container runtimes
+    "/run/.containerenv",  # Podman
+)
+
+_CGROUP_PATH = "/proc/1/cgroup"
+
+
+@lru_cache(maxsize=1)
+def _container_detection(cgroup_path: str = _CGROUP_PATH) -> bool:
+    """Detect container markers once per process; the answer cannot change."""
+    for path in _CONTAINER_MARKER_PATHS:
+        try:
+            os.stat(path)
+        except OSError:
+            continue
+        return True
+
+    # Check the init process cgroup for Docker/containerd
+    try:
+        with open(cgroup_path, "rb") as f:
+            content = f.read()
+    except OSError:
+        return False
+
+    return b"docker" in content or b"containerd" in content
+
 
 class WebEnvironmentDetector:
     """Detects and manages web environment information."""
@@ -23,6 +80,7 @@ class WebEnvironmentDetector:
         self._cache_lock = threading.Lock()
         self._detection_cache: bool | None = None
         self._forced_mode: ServiceMode | None = None
+        self._forced_is_web: bool | None = None
 
     def is_web_environment(self) -> bool:
         """
@@ -38,8 +96,8 @@ class WebEnvironmentDetector:
             bool: True if running in web environment, False otherwise
         """
         # Check for manual override first
-        if self._forced_mode is not None:
-            return self._forced_mode == ServiceMode.WEB
+        if self._forced_is_web is not None:
+            return self._forced_is_web
 
         # Use cached result if available
         if self._detection_cache is not None:
@@ -57,10 +115,12 @@ class WebEnvironmentDetector:
 
     def _detect_web_environment(self) -> bool:
         """Internal method to perform web environment detection."""
+        # Cheapest checks first: pure environment lookups, then the working
+        # directory and config files, then container filesystem probes
         detection_methods = [
             self._check_environment_variables,
-            self._check_deployment_context,
             self._check_web_server_indicators,
+            self._check_deployment_context,
             self._check_container_environment,
         ]
 
@@ -78,37 +138,13 @@ class WebEnvironmentDetector:
 
     def _check_environment_variables(self) -> bool:
         """Check environment variables for web environment indicators."""
+        env = os.environ
         # Check for explicit disable first - this should override any web indicators
-        if os.environ.get("REZ_PROXY_FORCE_LOCAL", "").lower() in ("true", "1", "yes"):
-            return False
-
-        web_env_indicators = [
-            # Explicit web environment markers
-            "REZ_PROXY_WEB_MODE",
-            "WEB_ENVIRONMENT",
-            "IS_WEB_ENV",
-            # Common web server environment variables
-            "SERVER_SOFTWARE",
-            "REQUEST_METHOD",
-            "HTTP_HOST",
-            "SCRIPT_NAME",
-            # Cloud/container platform indicators
-            "VERCEL",
-            "NETLIFY",
-            "HEROKU_APP_NAME",
-            "AWS_LAMBDA_FUNCTION_NAME",
-            "GOOGLE_CLOUD_PROJECT",
-            "AZURE_FUNCTIONS_ENVIRONMENT",
-            # Container orchestration
-            "KUBERNETES_SERVICE_HOST",
-            "DOCKER_CONTAINER",
-        ]
+        for key in _FORCE_LOCAL_KEYS & env.keys():
+            if env[key].lower() in ("true", "1", "yes"):
+                return False
 
-        for var in web_env_indicators:
-            if os.environ.get(var):
-                return True
-
-        return False
+        return any(env[key] for key in _WEB_ENV_KEYS & env.keys())
 
     def _check_deployment_context(self) -> bool:
         """Check deployment context indicators."""
@@ -158,33 +194,9 @@ class WebEnvironmentDetector:
 
         return False
 
-    def _check_container_environment(self) -> bool:
+    def _check_container_environment(self, cgroup_path: str = _CGROUP_PATH) -> bool:
         """Check if running in a container environment."""
-        container_indicators = [
-            # Docker
-            "/.dockerenv",
-            "/proc/1/cgroup",  # Check if we can detect container cgroup
-            # Kubernetes
-            "/var/run/secrets/kubernetes.io",
-            # Other container runtimes
-            "/run/.containerenv",  # Podman
-        ]
-
-        for indicator in container_indicators:
-            if os.path.exists(indicator):
-                # Additional check for Docker cgroup
-                if indicator == "/proc/1/cgroup":
-                    try:
-                        with open(indicator) as f:
-                            content = f.read()
-                            if "docker" in content or "containerd" in content:
-                                return True
-                    except OSError:
-                        pass
-                else:
-                    return True
-
-        return False
+        return _container_detection(cgroup_path)
 
     def get_service_mode(self) -> ServiceMode:
         """
@@ -211,11 +223,13 @@ class WebEnvironmentDetector:
             mode: ServiceMode to force
         """
         self._forced_mode = mode
+        self._forced_is_web = mode is ServiceMode.WEB
         self._clear_cache()
 
     def clear_forced_mode(self) -> None:
         """Clear any manual service mode override."""
         self._forced_mode = None
+        self._forced_is_web = None
         self._clear_cache()
 
     def _clear_cache(self) -> None:
@@ -319,5 +333,6 @@ def force_web_mode(enabled: bool = True) -> None:
 def clear_detection_cache() -> None:
     """Clear web environment detection cache."""
     get_web_detector()._clear_cache()
-    # Clear the lru_cache as well
+    # Clear the lru_caches as well
     is_web_environment.cache_clear()
+    _container_detection.cache_clear()
@@ -5,6 +5,7 @@ Rez Proxy - FastAPI application with versioning.
 from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import RedirectResponse
+from fastapi.routing import APIRoute, request_response
 from fastapi_versioning import VersionedFastAPI
 
 from rez_proxy.config import get_config
@@ -37,6 +38,17 @@ from rez_proxy.routers import (
 )
 
 
+def _disable_response_validation(app: FastAPI) -> None:
+    """Serialize route responses without validating them against response_model.
+
+    The response models are kept on the routes so the OpenAPI schema is unchanged.
+    """
+    for route in app.routes:
+        if isinstance(route, APIRoute) and route.secure_cloned_response_field:
+            route.secure_cloned_response_field = None
+            route.app = request_response(route.get_route_handler())
+
+
 def create_app() -> VersionedFastAPI:
     """Create FastAPI application with versioning."""
 
@@ -93,6 +105,9 @@ def create_app() -> VersionedFastAPI:
         web_detection.router, prefix="/web-detection", tags=["web-detection"]
     )
 
+    if not config.validate_responses:
+        _disable_response_validation(app)
+
     # Create versioned app first
     versioned_app = VersionedFastAPI(
         app,
@@ -104,6 +119,10 @@ def create_app() -> VersionedFastAPI:
         redoc_url=config.redoc_url,
     )
 
+    # Routes resolve dependency overrides through the base app; share them so
+    # overrides set on the returned app take effect
+    app.dependency_overrides = versioned_app.dependency_overrides
+
     # Register exception handlers
     versioned_app.add_exception_handler(RezProxyError, rez_proxy_exception_handler)
     versioned_app.add_exception_handler(HTTPException, http_exception_handler)
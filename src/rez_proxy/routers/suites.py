@@ -7,7 +7,7 @@ import tempfile
 import uuid
 from typing import Any
 
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, Depends, HTTPException
 from fastapi_versioning import version
 from pydantic import BaseModel, Field
 
@@ -19,6 +19,11 @@ router = APIRouter()
 _suites: dict[str, dict[str, Any]] = {}
 
 
+def get_suites_store() -> dict[str, dict[str, Any]]:
+    """Get the suite storage used by the endpoints."""
+    return _suites
+
+
 class SuiteCreateRequest(BaseModel):
     """Request to create a new suite."""
 
@@ -58,7 +63,10 @@ class SuiteToolAliasRequest(BaseModel):
 
 @router.post("/", response_model=SuiteInfo)
 @version(1)
-async def create_suite(request: SuiteCreateRequest) -> SuiteInfo:
+async def create_suite(
+    request: SuiteCreateRequest,
+    suites: dict[str, dict[str, Any]] = Depends(get_suites_store),
+) -> SuiteInfo:
     """Create a new suite."""
     from datetime import datetime
 
@@ -77,7 +85,7 @@ async def create_suite(request: SuiteCreateRequest) -> SuiteInfo:
             "created_at": datetime.utcnow().isoformat(),
             "status": "created",
         }
-        _suites[suite_id] = suite_info
+        suites[suite_id] = suite_info
 
         return SuiteInfo(
             id=suite_id,
@@ -94,13 +102,15 @@ async def create_suite(request: SuiteCreateRequest) -> SuiteInfo:
 
 @router.get("/{suite_id}", response_model=SuiteInfo)
 @version(1)
-async def get_suite(suite_id: str) -> SuiteInfo:
+async def get_suite(
+    suite_id: str, suites: dict[str, dict[str, Any]] = Depends(get_suites_store)
+) -> SuiteInfo:
     """Get information about a specific suite."""
-    if suite_id not in _suites:
+    if suite_id not in suites:
         raise HTTPException(status_code=404, detail=f"Suite '{suite_id}' not found")
 
     try:
-        suite_info = _suites[suite_id]
+        suite_info = suites[suite_id]
         suite = suite_info["suite"]
 
         # Get tools from suite
@@ -139,10 +149,12 @@ async def get_suite(suite_id: str) -> SuiteInfo:
 @router.post("/{suite_id}/contexts")
 @version(1)
 async def add_context_to_suite(
-    suite_id: str, request: SuiteAddContextRequest
+    suite_id: str,
+    request: SuiteAddContextRequest,
+    suites: dict[str, dict[str, Any]] = Depends(get_suites_store),
 ) -> dict[str, str]:
     """Add a context to a suite."""
-    if suite_id not in _suites:
+    if suite_id not in suites:
         raise HTTPException(status_code=404, detail=f"Suite '{suite_id}' not found")
 
     try:
@@ -155,7 +167,7 @@ async def add_context_to_suite(
                 detail=f"Environment '{request.environment_id}' not found",
             )
 
-        suite_info = _suites[suite_id]
+        suite_info = suites[suite_id]
         suite = suite_info["suite"]
         env_info = _environments[request.environment_id]
         context = env_info["context"]
@@ -179,14 +191,16 @@ async def add_context_to_suite(
 @router.post("/{suite_id}/tools/alias")
 @version(1)
 async def alias_tool_in_suite(
-    suite_id: str, request: SuiteToolAliasRequest
+    suite_id: str,
+    request: SuiteToolAliasRequest,
+    suites: dict[str, dict[str, Any]] = Depends(get_suites_store),
 ) -> dict[str, str]:
     """Create an alias for a tool in a suite."""
-    if suite_id not in _suites:
+    if suite_id not in suites:
         raise HTTPException(status_code=404, detail=f"Suite '{suite_id}' not found")
 
     try:
-        suite_info = _suites[suite_id]
+        suite_info = suites[suite_id]
         suite = suite_info["suite"]
 
         # Alias the tool
@@ -214,13 +228,17 @@ async def alias_tool_in_suite(
         "Export suite configuration as JSON for manual saving",
     ],
 )
-async def save_suite(suite_id: str, path: str | None = None) -> dict[str, str]:
+async def save_suite(
+    suite_id: str,
+    path: str | None = None,
+    suites: dict[str, dict[str, Any]] = Depends(get_suites_store),
+) -> dict[str, str]:
     """Save a suite to disk."""
-    if suite_id not in _suites:
+    if suite_id not in suites:
         raise HTTPException(status_code=404, detail=f"Suite '{suite_id}' not found")
 
     try:
-        suite_info = _suites[suite_id]
+        suite_info = suites[suite_id]
         suite = suite_info["suite"]
 
         # Use provided path or create temporary directory
@@ -240,13 +258,15 @@ async def save_suite(suite_id: str, path: str | None = None) -> dict[str, str]:
 
 @router.get("/{suite_id}/tools")
 @version(1)
-async def get_suite_tools(suite_id: str) -> dict[str, Any]:
+async def get_suite_tools(
+    suite_id: str, suites: dict[str, dict[str, Any]] = Depends(get_suites_store)
+) -> dict[str, Any]:
     """Get all tools available in a suite."""
-    if suite_id not in _suites:
+    if suite_id not in suites:
         raise HTTPException(status_code=404, detail=f"Suite '{suite_id}' not found")
 
     try:
-        suite_info = _suites[suite_id]
+        suite_info = suites[suite_id]
         suite = suite_info["suite"]
 
         # Get tools and conflicts safely
@@ -286,21 +306,25 @@ async def get_suite_tools(suite_id: str) -> dict[str, Any]:
 
 @router.delete("/{suite_id}")
 @version(1)
-async def delete_suite(suite_id: str) -> dict[str, str]:
+async def delete_suite(
+    suite_id: str, suites: dict[str, dict[str, Any]] = Depends(get_suites_store)
+) -> dict[str, str]:
     """Delete a suite."""
-    if suite_id not in _suites:
+    if suite_id not in suites:
         raise HTTPException(status_code=404, detail=f"Suite '{suite_id}' not found")
 
-    del _suites[suite_id]
+    del suites[suite_id]
     return {"message": f"Suite '{suite_id}' deleted successfully"}
 
 
 @router.get("/")
 @version(1)
-async def list_suites() -> dict[str, Any]:
+async def list_suites(
+    suites: dict[str, dict[str, Any]] = Depends(get_suites_store),
+) -> dict[str, Any]:
     """List all suites."""
-    suites = []
-    for suite_id, suite_info in _suites.items():
+    suite_list = []
+    for suite_id, suite_info in suites.items():
         suite = suite_info["suite"]
 
         # Get context names safely
@@ -310,7 +334,7 @@ async def list_suites() -> dict[str, Any]:
         except Exception:
             contexts = []
 
-        suites.append(
+        suite_list.append(
             {
                 "id": suite_id,
                 "name": suite_info["name"],
@@ -322,6 +346,6 @@ async def list_suites() -> dict[str, Any]:
         )
 
     return {
-        "suites": suites,
-        "total": len(suites),
+        "suites": suite_list,
+        "total": len(suite_list),
     }
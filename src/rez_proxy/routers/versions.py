@@ -2,7 +2,7 @@
 Version and requirement API endpoints.
 """
 
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, HTTPException, Query
 from pydantic import BaseModel
 
 from rez_proxy.core.rez_imports import requires_rez, rez_api
@@ -174,7 +174,7 @@ async def check_requirement_satisfaction(
 @router.get("/latest")
 @requires_rez
 async def get_latest_versions(
-    packages: list[str],
+    packages: list[str] = Query(..., description="Package names to look up"),
     limit: int = 10,
 ) -> dict[str, dict[str, str | None]]:
     """Get latest versions of specified packages."""
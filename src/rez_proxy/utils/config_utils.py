@@ -4,11 +4,43 @@ Configuration management utilities.
 
 import json
 import os
+import re
+import threading
 from collections.abc import Callable
 from typing import Any
 
 from rez_proxy.config import RezProxyConfig, get_config_manager
 
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+_TEMPLATE_RE = re.compile(r"\$\{([^}]+)\}")
+
+
+def _loads(data: str | bytes) -> Any:
+    """Parse JSON text, using orjson when it is installed."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _dumps(obj: Any) -> str:
+    """Serialize an object as indented JSON text, using orjson when installed."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+    return json.dumps(obj, indent=2, ensure_ascii=False)
+
+
+def _load_json(file_path: str) -> dict[str, Any]:
+    """Load and parse a JSON configuration file."""
+    with open(file_path, encoding="utf-8") as f:
+        config_data: dict[str, Any] = _loads(f.read())
+    return config_data
+
 
 def create_default_config_file(file_path: str) -> None:
     """Create a default configuration file."""
@@ -25,8 +57,8 @@ def create_default_config_file(file_path: str) -> None:
     if config_dir:
         os.makedirs(config_dir, exist_ok=True)
 
-    with open(file_path, "w") as f:
-        json.dump(config_dict, f, indent=2)
+    with open(file_path, "w", encoding="utf-8") as f:
+        f.write(_dumps(config_dict))
 
     print(f"✅ Default configuration file created: {file_path}")
 
@@ -47,8 +79,7 @@ def validate_config_file(file_path: str) -> dict[str, Any]:
             return result
 
         # Load and parse JSON
-        with open(file_path) as f:
-            config_data = json.load(f)
+        config_data = _load_json(file_path)
 
         # Validate against schema
         try:
@@ -91,15 +122,13 @@ def validate_config_file(file_path: str) -> dict[str, Any]:
 def merge_config_files(base_file: str, override_file: str, output_file: str) -> None:
     """Merge two configuration files."""
     # Load base configuration
-    with open(base_file) as f:
-        base_config = json.load(f)
+    base_config = _load_json(base_file)
 
     # Load override configuration
-    with open(override_file) as f:
-        override_config = json.load(f)
+    override_config = _load_json(override_file)
 
     # Merge configurations (override takes precedence)
-    merged_config = {**base_config, **override_config}
+    merged_config = base_config | override_config
 
     # Validate merged configuration
     validation_result = validate_config_file_data(merged_config)
@@ -109,8 +138,8 @@ def merge_config_files(base_file: str, override_file: str, output_file: str) ->
         )
 
     # Save merged configuration
-    with open(output_file, "w") as f:
-        json.dump(merged_config, f, indent=2)
+    with open(output_file, "w", encoding="utf-8") as f:
+        f.write(_dumps(merged_config))
 
     print(
         f"✅ Configuration files merged: {base_file} + {override_file} -> {output_file}"
@@ -162,10 +191,10 @@ def backup_config_file(file_path: str, backup_suffix: str = ".backup") -> str:
         timestamp = int(time.time())
         backup_path = f"{file_path}.backup.{timestamp}"
 
-    # Copy file
+    # Copy file contents and permission bits (configs may hold secrets)
     import shutil
 
-    shutil.copy2(file_path, backup_path)
+    shutil.copy(file_path, backup_path)
 
     print(f"📋 Configuration backup created: {backup_path}")
     return backup_path
@@ -176,43 +205,58 @@ def restore_config_from_backup(backup_path: str, target_path: str) -> None:
     if not os.path.exists(backup_path):
         raise FileNotFoundError(f"Backup file not found: {backup_path}")
 
-    # Validate backup file first
-    validation_result = validate_config_file(backup_path)
+    # Read the backup once; the validated bytes are what gets restored
+    with open(backup_path, "rb") as f:
+        data = f.read()
+
+    try:
+        config_data = _loads(data)
+    except (json.JSONDecodeError, UnicodeDecodeError) as e:
+        raise ValueError(
+            f"Backup configuration is invalid: Invalid JSON format: {e}"
+        ) from e
+
+    validation_result = validate_config_file_data(config_data)
     if not validation_result["valid"]:
         raise ValueError(
             f"Backup configuration is invalid: {validation_result['errors']}"
         )
 
-    # Copy backup to target
+    with open(target_path, "wb") as f:
+        f.write(data)
+
+    # Match the backup's permission bits (configs may hold secrets)
     import shutil
 
-    shutil.copy2(backup_path, target_path)
+    shutil.copymode(backup_path, target_path)
 
     print(f"🔄 Configuration restored from backup: {backup_path} -> {target_path}")
 
 
 def get_config_diff(file1: str, file2: str) -> dict[str, Any]:
     """Get differences between two configuration files."""
-    with open(file1) as f:
-        config1 = json.load(f)
-
-    with open(file2) as f:
-        config2 = json.load(f)
-
-    diff: dict[str, Any] = {"added": {}, "removed": {}, "changed": {}, "unchanged": {}}
-
-    all_keys = set(config1.keys()) | set(config2.keys())
-
-    for key in all_keys:
-        if key in config1 and key in config2:
-            if config1[key] != config2[key]:
-                diff["changed"][key] = {"old": config1[key], "new": config2[key]}
-            else:
-                diff["unchanged"][key] = config1[key]
-        elif key in config1:
-            diff["removed"][key] = config1[key]
-        else:
-            diff["added"][key] = config2[key]
+    with open(file1, encoding="utf-8") as f:
+        config1 = _loads(f.read())
+
+    with open(file2, encoding="utf-8") as f:
+        config2 = _loads(f.read())
+
+    keys1 = config1.keys()
+    keys2 = config2.keys()
+    common = keys1 & keys2
+
+    diff: dict[str, Any] = {
+        "added": {key: config2[key] for key in keys2 - keys1},
+        "removed": {key: config1[key] for key in keys1 - keys2},
+        "changed": {
+            key: {"old": config1[key], "new": config2[key]}
+            for key in common
+            if config1[key] != config2[key]
+        },
+        "unchanged": {
+            key: config1[key] for key in common if config1[key] == config2[key]
+        },
+    }
 
     return diff
 
@@ -221,17 +265,18 @@ def apply_config_template(
     template_file: str, variables: dict[str, Any], output_file: str
 ) -> None:
     """Apply variables to a configuration template."""
-    with open(template_file) as f:
+    with open(template_file, encoding="utf-8") as f:
         template_content = f.read()
 
-    # Simple variable substitution
-    for key, value in variables.items():
-        placeholder = f"${{{key}}}"
-        template_content = template_content.replace(placeholder, str(value))
+    # Substitute all ${NAME} placeholders in one pass, leaving unknown names as-is
+    template_content = _TEMPLATE_RE.sub(
+        lambda m: str(variables[m.group(1)]) if m.group(1) in variables else m.group(0),
+        template_content,
+    )
 
     # Parse as JSON to validate
     try:
-        config_data = json.loads(template_content)
+        config_data = _loads(template_content)
     except json.JSONDecodeError as e:
         raise ValueError(f"Template resulted in invalid JSON: {e}")
 
@@ -243,8 +288,8 @@ def apply_config_template(
         )
 
     # Save output
-    with open(output_file, "w") as f:
-        json.dump(config_data, f, indent=2)
+    with open(output_file, "w", encoding="utf-8") as f:
+        f.write(_dumps(config_data))
 
     print(f"📝 Configuration template applied: {template_file} -> {output_file}")
 
@@ -267,3 +312,36 @@ def watch_config_changes(callback_func: Callable) -> Callable:
         return wrapper
 
     return decorator
+
+
+def watch_config_changes_v2(callback_func: Callable) -> Callable:
+    """Decorator to watch for configuration changes with a single registration.
+
+    The callback is registered once when the decorator is created and is only
+    dispatched while a decorated call is running, so calls do not modify the
+    config manager's callback list.
+    """
+    active_calls = 0
+    lock = threading.Lock()
+
+    def gated_callback(new_config: RezProxyConfig) -> None:
+        if active_calls:
+            callback_func(new_config)
+
+    get_config_manager().add_change_callback(gated_callback)
+
+    def decorator(func: Callable) -> Callable:
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            nonlocal active_calls
+            with lock:
+                active_calls += 1
+
+            try:
+                return func(*args, **kwargs)
+            finally:
+                with lock:
+                    active_calls -= 1
+
+        return wrapper
+
+    return decorator
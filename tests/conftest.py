@@ -2,21 +2,49 @@
 Pytest configuration and fixtures.
 """
 
+import functools
 import os
 from unittest.mock import Mock
 
 import pytest
 from fastapi.testclient import TestClient
 
+from rez_proxy.config import reload_config
 from rez_proxy.main import create_app
 from rez_proxy.models.schemas import ClientContext, PlatformInfo, ServiceMode
 
 
+@functools.lru_cache(maxsize=1)
+def _app():
+    """Build the FastAPI app once for all tests that can share it."""
+    return create_app()
+
+
+@pytest.fixture(scope="session")
+def shared_client():
+    """Create a test client shared by the whole session.
+
+    Entering the client runs the app lifespan once and keeps its transport
+    open across tests.
+    """
+    with TestClient(_app()) as test_client:
+        yield test_client
+
+
 @pytest.fixture
-def client():
-    """Create test client."""
-    app = create_app()
-    return TestClient(app)
+def client(request, validate_responses):
+    """Return the shared test client.
+
+    The shared app is built with response validation disabled, so tests
+    marked ``validate_responses`` get a fresh app built after validation is
+    re-enabled.
+    """
+    if request.node.get_closest_marker("validate_responses") is None:
+        yield request.getfixturevalue("shared_client")
+        return
+
+    with TestClient(create_app()) as test_client:
+        yield test_client
 
 
 @pytest.fixture
@@ -156,6 +184,34 @@ def mock_build_system():
     }
 
 
+@pytest.fixture(scope="session", autouse=True)
+def disable_response_validation():
+    """Skip response model validation in apps built by tests."""
+    original_value = os.environ.get("REZ_PROXY_API_VALIDATE_RESPONSES")
+    os.environ["REZ_PROXY_API_VALIDATE_RESPONSES"] = "false"
+    reload_config()
+    yield
+    if original_value is None:
+        os.environ.pop("REZ_PROXY_API_VALIDATE_RESPONSES", None)
+    else:
+        os.environ["REZ_PROXY_API_VALIDATE_RESPONSES"] = original_value
+    reload_config()
+
+
+@pytest.fixture(autouse=True)
+def validate_responses(request):
+    """Re-enable response validation for tests marked ``validate_responses``."""
+    if request.node.get_closest_marker("validate_responses") is None:
+        yield
+        return
+
+    os.environ["REZ_PROXY_API_VALIDATE_RESPONSES"] = "true"
+    reload_config()
+    yield
+    os.environ["REZ_PROXY_API_VALIDATE_RESPONSES"] = "false"
+    reload_config()
+
+
 @pytest.fixture(autouse=True)
 def disable_web_compatibility():
     """Disable web compatibility checks for all tests."""
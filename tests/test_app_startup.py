@@ -8,6 +8,17 @@ from fastapi.testclient import TestClient
 from rez_proxy.main import create_app
 
 
+def _get_suite_routes(app):
+    """Return the versioned ``GET /suites/{suite_id}`` routes of an app."""
+    return [
+        route
+        for mount in app.routes
+        if getattr(mount, "path", None) == "/api/v1"
+        for route in mount.app.routes
+        if getattr(route, "path", "") == "/suites/{suite_id}" and "GET" in route.methods
+    ]
+
+
 class TestAppStartup:
     """Test application startup and basic endpoints."""
 
@@ -75,3 +86,40 @@ class TestAppStartup:
             )
             # Should not return 404 (endpoint exists)
             assert response.status_code != 404, f"Endpoint {endpoint} should exist"
+
+    def test_response_validation_disabled_keeps_schema(self):
+        """Test that disabling response validation keeps response models in docs."""
+        app = create_app()
+        suite_routes = _get_suite_routes(app)
+
+        assert suite_routes
+        assert suite_routes[0].secure_cloned_response_field is None
+        assert suite_routes[0].response_field is not None
+
+    @pytest.mark.validate_responses
+    def test_response_validation_enabled(self):
+        """Test that response validation can be re-enabled per test."""
+        app = create_app()
+        suite_routes = _get_suite_routes(app)
+
+        assert suite_routes
+        assert suite_routes[0].secure_cloned_response_field is not None
+
+
+class TestSharedClientResponseValidation:
+    """Test response validation on the shared conftest client."""
+
+    def test_shared_client_skips_validation(self, client):
+        """Test that unmarked tests use the shared app without validation."""
+        suite_routes = _get_suite_routes(client.app)
+
+        assert suite_routes
+        assert suite_routes[0].secure_cloned_response_field is None
+
+    @pytest.mark.validate_responses
+    def test_marked_client_validates_responses(self, client):
+        """Test that marked tests get a client whose app validates responses."""
+        suite_routes = _get_suite_routes(client.app)
+
+        assert suite_routes
+        assert suite_routes[0].secure_cloned_response_field is not None
@@ -17,10 +17,11 @@ def client():
     """Create test client."""
     app = create_app()
     # Force local mode for testing
-    from rez_proxy.core.web_detector import force_web_mode
+    from rez_proxy.core.web_detector import force_web_mode, get_web_detector
 
     force_web_mode(enabled=False)
-    return TestClient(app)
+    yield TestClient(app)
+    get_web_detector().clear_forced_mode()
 
 
 @pytest.fixture
@@ -12,6 +12,8 @@ import pytest
 from fastapi import FastAPI
 from fastapi.testclient import TestClient
 
+from rez_proxy.core.web_detector import get_web_detector
+from rez_proxy.models.schemas import ServiceMode
 from rez_proxy.routers.package_ops import (
     PackageOpsService,
     copy_package_impl,
@@ -38,8 +40,11 @@ def app():
 
 @pytest.fixture
 def client(app):
-    """Create test client."""
-    return TestClient(app)
+    """Create test client with the global detector forced to local mode."""
+    detector = get_web_detector()
+    detector.force_service_mode(ServiceMode.LOCAL)
+    yield TestClient(app)
+    detector.clear_forced_mode()
 
 
 @pytest.fixture
@@ -167,7 +167,7 @@ class TestResolverRouter:
         # Setup mock package with dependencies
         dep_req = MagicMock()
         dep_req.name = "dependency"
-        dep_req.__str__ = lambda: "dependency>=1.0"
+        dep_req.__str__ = MagicMock(return_value="dependency>=1.0")
         mock_rez_package.requires = [dep_req]
 
         # Mock the iter_packages function to return our mock package
@@ -473,7 +473,7 @@ class TestResolverRouter:
 
         dep_req = MagicMock()
         dep_req.name = "circular-package"  # Self-dependency
-        dep_req.__str__ = lambda: "circular-package>=1.0"
+        dep_req.__str__ = MagicMock(return_value="circular-package>=1.0")
         mock_package.requires = [dep_req]
 
         with patch("rez_proxy.core.rez_imports.rez_api") as mock_api:
@@ -3,25 +3,61 @@ Comprehensive tests for suites router.
 """
 
 import uuid
-from datetime import datetime
-from unittest.mock import MagicMock, PropertyMock, patch
+from unittest.mock import MagicMock, patch
 
 import pytest
 from fastapi.testclient import TestClient
 
 from rez_proxy.main import create_app
+from rez_proxy.routers.suites import get_suites_store
 
+_FIXED_CREATED_AT = "2024-01-01T00:00:00"
 
-@pytest.fixture
-def client():
-    """Create test client."""
+# Request bodies shared by tests; treat as read-only.
+_ALIAS_BODY = {
+    "context_name": "test-context",
+    "tool_name": "python",
+    "alias_name": "py",
+}
+_CTX_BODY_TEMPLATE = {"context_name": "test-context"}
+
+
+class _FakeTool:
+    """Minimal stand-in for a Rez suite tool."""
+
+    def __init__(self, context_name, command):
+        self.context_name = context_name
+        self._command = command
+
+    def __str__(self):
+        return self._command
+
+
+class _Raiser:
+    """Descriptor that raises the given exception on every attribute read."""
+
+    def __init__(self, exc):
+        self.exc = exc
+
+    def __get__(self, obj, cls):
+        raise self.exc
+
+
+def _build_client(store):
+    """Build a test client whose suite endpoints use the given storage."""
     app = create_app()
+    app.dependency_overrides[get_suites_store] = lambda: store
     return TestClient(app)
 
 
 @pytest.fixture
-def mock_suite():
-    """Create a mock Rez Suite."""
+def client():
+    """Create test client with isolated suites storage."""
+    return _build_client({})
+
+
+def _build_mock_suite():
+    """Build a mock Rez Suite."""
     suite = MagicMock()
     suite.context_names = []
     suite.get_tools.return_value = {}
@@ -32,32 +68,34 @@ def mock_suite():
     return suite
 
 
-@pytest.fixture
-def mock_environment():
-    """Create a mock environment for testing."""
+def _build_mock_environment():
+    """Build a mock resolved environment entry."""
     context = MagicMock()
     context.resolved_packages = []
     return {
         "context": context,
         "packages": ["python-3.9"],
-        "created_at": datetime.utcnow().isoformat(),
+        "created_at": _FIXED_CREATED_AT,
         "status": "resolved",
     }
 
 
-@pytest.fixture(autouse=True)
-def clear_suites():
-    """Clear suites storage before each test."""
-    from rez_proxy.routers.suites import _suites
+@pytest.fixture
+def mock_suite():
+    """Create a mock Rez Suite."""
+    return _build_mock_suite()
 
-    _suites.clear()
-    yield
-    _suites.clear()
+
+@pytest.fixture
+def mock_environment():
+    """Create a mock environment for testing."""
+    return _build_mock_environment()
 
 
 class TestSuiteCreation:
     """Test suite creation functionality."""
 
+    @pytest.mark.validate_responses
     @patch("rez.suite.Suite")
     def test_create_suite_success(self, mock_suite_class, client, mock_suite):
         """Test successful suite creation."""
@@ -114,6 +152,7 @@ class TestSuiteCreation:
 class TestSuiteRetrieval:
     """Test suite retrieval functionality."""
 
+    @pytest.mark.validate_responses
     @patch("rez.suite.Suite")
     def test_get_suite_success(self, mock_suite_class, client, mock_suite):
         """Test successful suite retrieval."""
@@ -123,10 +162,9 @@ class TestSuiteRetrieval:
         suite_id = create_response.json()["id"]
 
         # Mock tools for retrieval
-        mock_tool = MagicMock()
-        mock_tool.context_name = "test-context"
-        mock_tool.__str__ = lambda self: "test-command"
-        mock_suite.get_tools.return_value = {"test-tool": mock_tool}
+        mock_suite.get_tools.return_value = {
+            "test-tool": _FakeTool("test-context", "test-command")
+        }
         mock_suite.context_names = ["test-context"]
 
         # Get the suite
@@ -171,16 +209,13 @@ class TestSuiteContextManagement:
     """Test suite context management functionality."""
 
     @patch("rez.suite.Suite")
-    @patch("rez_proxy.routers.environments._environments")
     def test_add_context_to_suite_success(
-        self, mock_environments, mock_suite_class, client, mock_suite, mock_environment
+        self, mock_suite_class, client, mock_suite, mock_environment
     ):
         """Test successfully adding context to suite."""
         # Setup
         mock_suite_class.return_value = mock_suite
         env_id = str(uuid.uuid4())
-        mock_environments.__contains__ = lambda self, x: x == env_id
-        mock_environments.__getitem__ = lambda self, x: mock_environment
 
         # Create suite
         create_response = client.post("/api/v1/suites/", json={"name": "test-suite"})
@@ -188,12 +223,19 @@ class TestSuiteContextManagement:
 
         # Add context
         request_data = {
-            "context_name": "test-context",
+            **_CTX_BODY_TEMPLATE,
             "environment_id": env_id,
             "prefix_char": "t",
         }
 
-        response = client.post(f"/api/v1/suites/{suite_id}/contexts", json=request_data)
+        with patch.dict(
+            "rez_proxy.routers.environments._environments",
+            {env_id: mock_environment},
+            clear=True,
+        ):
+            response = client.post(
+                f"/api/v1/suites/{suite_id}/contexts", json=request_data
+            )
 
         assert response.status_code == 200
         assert "added to suite" in response.json()["message"]
@@ -202,34 +244,27 @@ class TestSuiteContextManagement:
     def test_add_context_suite_not_found(self, client):
         """Test adding context to non-existent suite."""
         fake_id = str(uuid.uuid4())
-        request_data = {
-            "context_name": "test-context",
-            "environment_id": str(uuid.uuid4()),
-        }
+        request_data = {**_CTX_BODY_TEMPLATE, "environment_id": str(uuid.uuid4())}
 
         response = client.post(f"/api/v1/suites/{fake_id}/contexts", json=request_data)
 
         assert response.status_code == 404
 
     @patch("rez.suite.Suite")
-    @patch("rez_proxy.routers.environments._environments")
+    @patch.dict("rez_proxy.routers.environments._environments", {}, clear=True)
     def test_add_context_environment_not_found(
-        self, mock_environments, mock_suite_class, client, mock_suite
+        self, mock_suite_class, client, mock_suite
     ):
         """Test adding non-existent environment to suite."""
         # Setup
         mock_suite_class.return_value = mock_suite
-        mock_environments.__contains__ = lambda self, x: False
 
         # Create suite
         create_response = client.post("/api/v1/suites/", json={"name": "test-suite"})
         suite_id = create_response.json()["id"]
 
         # Try to add non-existent environment
-        request_data = {
-            "context_name": "test-context",
-            "environment_id": str(uuid.uuid4()),
-        }
+        request_data = {**_CTX_BODY_TEMPLATE, "environment_id": str(uuid.uuid4())}
 
         response = client.post(f"/api/v1/suites/{suite_id}/contexts", json=request_data)
 
@@ -249,14 +284,8 @@ class TestSuiteToolManagement:
         suite_id = create_response.json()["id"]
 
         # Alias tool
-        request_data = {
-            "context_name": "test-context",
-            "tool_name": "python",
-            "alias_name": "py",
-        }
-
         response = client.post(
-            f"/api/v1/suites/{suite_id}/tools/alias", json=request_data
+            f"/api/v1/suites/{suite_id}/tools/alias", json=_ALIAS_BODY
         )
 
         assert response.status_code == 200
@@ -266,14 +295,8 @@ class TestSuiteToolManagement:
     def test_alias_tool_suite_not_found(self, client):
         """Test aliasing tool in non-existent suite."""
         fake_id = str(uuid.uuid4())
-        request_data = {
-            "context_name": "test-context",
-            "tool_name": "python",
-            "alias_name": "py",
-        }
-
         response = client.post(
-            f"/api/v1/suites/{fake_id}/tools/alias", json=request_data
+            f"/api/v1/suites/{fake_id}/tools/alias", json=_ALIAS_BODY
         )
 
         assert response.status_code == 404
@@ -287,10 +310,9 @@ class TestSuiteToolManagement:
         suite_id = create_response.json()["id"]
 
         # Mock tools
-        mock_tool = MagicMock()
-        mock_tool.context_name = "test-context"
-        mock_tool.__str__ = lambda self: "test-command"
-        mock_suite.get_tools.return_value = {"test-tool": mock_tool}
+        mock_suite.get_tools.return_value = {
+            "test-tool": _FakeTool("test-context", "test-command")
+        }
         mock_suite.tool_conflicts = {"conflicted-tool": "conflict reason"}
 
         response = client.get(f"/api/v1/suites/{suite_id}/tools")
@@ -476,12 +498,13 @@ class TestSuiteErrorHandling:
         # Mock add_context error
         mock_suite.add_context.side_effect = Exception("Rez context error")
 
-        with patch("rez_proxy.routers.environments._environments") as mock_environments:
-            env_id = str(uuid.uuid4())
-            mock_environments.__contains__ = lambda self, x: x == env_id
-            mock_environments.__getitem__ = lambda self, x: mock_environment
-
-            request_data = {"context_name": "test-context", "environment_id": env_id}
+        env_id = str(uuid.uuid4())
+        with patch.dict(
+            "rez_proxy.routers.environments._environments",
+            {env_id: mock_environment},
+            clear=True,
+        ):
+            request_data = {**_CTX_BODY_TEMPLATE, "environment_id": env_id}
 
             response = client.post(
                 f"/api/v1/suites/{suite_id}/contexts", json=request_data
@@ -500,14 +523,8 @@ class TestSuiteErrorHandling:
         # Mock alias_tool error
         mock_suite.alias_tool.side_effect = Exception("Rez alias error")
 
-        request_data = {
-            "context_name": "test-context",
-            "tool_name": "python",
-            "alias_name": "py",
-        }
-
         response = client.post(
-            f"/api/v1/suites/{suite_id}/tools/alias", json=request_data
+            f"/api/v1/suites/{suite_id}/tools/alias", json=_ALIAS_BODY
         )
 
         assert response.status_code == 500
@@ -539,9 +556,7 @@ class TestSuiteErrorHandling:
         suite_id = create_response.json()["id"]
 
         # Mock context_names access error
-        type(mock_suite).context_names = PropertyMock(
-            side_effect=Exception("Rez context error")
-        )
+        type(mock_suite).context_names = _Raiser(Exception("Rez context error"))
 
         response = client.get(f"/api/v1/suites/{suite_id}")
 
@@ -550,85 +565,114 @@ class TestSuiteErrorHandling:
         assert response.json()["contexts"] == []
 
 
-class TestSuiteIntegration:
-    """Test suite integration scenarios."""
+class TestFullWorkflow:
+    """Test complete suite workflow, one step per test on a shared suite."""
 
-    @patch("rez.suite.Suite")
-    def test_full_suite_workflow(
-        self, mock_suite_class, client, mock_suite, mock_environment
-    ):
-        """Test complete suite workflow."""
-        # Setup
-        mock_suite_class.return_value = mock_suite
-        mock_suite.context_names = []
+    _SUITES_URL = "/api/v1/suites/"
+    _WORKFLOW_ALIAS_BODY = {
+        "context_name": "python-context",
+        "tool_name": "python",
+        "alias_name": "py",
+    }
 
-        # 1. Create suite
-        create_response = client.post(
-            "/api/v1/suites/",
-            json={"name": "integration-suite", "description": "Full workflow test"},
-        )
-        assert create_response.status_code == 200
-        suite_id = create_response.json()["id"]
+    @pytest.fixture(scope="class")
+    def workflow(self):
+        """Create a suite and add a context to it once for the whole class.
 
-        # 2. Add context
-        with patch("rez_proxy.routers.environments._environments") as mock_environments:
-            env_id = str(uuid.uuid4())
-            mock_environments.__contains__ = lambda self, x: x == env_id
-            mock_environments.__getitem__ = lambda self, x: mock_environment
+        The returned state (client, suite id and URL, mocked suite) is shared
+        by every step; only ``test_delete_suite`` mutates it and runs last.
+        """
+        client = _build_client({})
+        mock_suite = _build_mock_suite()
+        mock_environment = _build_mock_environment()
+        env_id = str(uuid.uuid4())
+
+        with (
+            patch("rez.suite.Suite", return_value=mock_suite),
+            patch.dict(
+                "rez_proxy.routers.environments._environments",
+                {env_id: mock_environment},
+                clear=True,
+            ),
+        ):
+            create_response = client.post(
+                self._SUITES_URL,
+                json={"name": "integration-suite", "description": "Full workflow test"},
+            )
+            suite_id = create_response.json()["id"]
+            suite_url = f"{self._SUITES_URL}{suite_id}"
 
             context_response = client.post(
-                f"/api/v1/suites/{suite_id}/contexts",
+                f"{suite_url}/contexts",
                 json={
                     "context_name": "python-context",
                     "environment_id": env_id,
                     "prefix_char": "p",
                 },
             )
-            assert context_response.status_code == 200
-            mock_suite.context_names = ["python-context"]
-
-        # 3. Alias tool
-        alias_response = client.post(
-            f"/api/v1/suites/{suite_id}/tools/alias",
-            json={
-                "context_name": "python-context",
-                "tool_name": "python",
-                "alias_name": "py",
-            },
+
+        mock_suite.context_names = ["python-context"]
+
+        mock_suite.get_tools.return_value = {
+            "py": _FakeTool("python-context", "python")
+        }
+
+        return {
+            "client": client,
+            "suite_id": suite_id,
+            "suite_url": suite_url,
+            "mock_suite": mock_suite,
+            "create_response": create_response,
+            "context_response": context_response,
+        }
+
+    def test_create_suite(self, workflow):
+        """Test the suite was created."""
+        assert workflow["create_response"].status_code == 200
+
+    def test_add_context(self, workflow):
+        """Test the context was added to the suite."""
+        assert workflow["context_response"].status_code == 200
+        workflow["mock_suite"].add_context.assert_called_once()
+
+    def test_alias_tool(self, workflow):
+        """Test aliasing a tool in the suite."""
+        response = workflow["client"].post(
+            f"{workflow['suite_url']}/tools/alias", json=self._WORKFLOW_ALIAS_BODY
         )
-        assert alias_response.status_code == 200
-
-        # 4. Get tools
-        mock_tool = MagicMock()
-        mock_tool.context_name = "python-context"
-        mock_tool.__str__ = lambda self: "python"
-        mock_suite.get_tools.return_value = {"py": mock_tool}
-
-        tools_response = client.get(f"/api/v1/suites/{suite_id}/tools")
-        assert tools_response.status_code == 200
-        assert "py" in tools_response.json()["tools"]
-
-        # 5. Save suite
-        save_response = client.post(f"/api/v1/suites/{suite_id}/save")
-        assert save_response.status_code == 200
-
-        # 6. Get suite info
-        info_response = client.get(f"/api/v1/suites/{suite_id}")
-        assert info_response.status_code == 200
-        suite_data = info_response.json()
+        assert response.status_code == 200
+
+    def test_get_tools(self, workflow):
+        """Test listing the suite tools."""
+        response = workflow["client"].get(f"{workflow['suite_url']}/tools")
+        assert response.status_code == 200
+        assert "py" in response.json()["tools"]
+
+    def test_save_suite(self, workflow):
+        """Test saving the suite."""
+        response = workflow["client"].post(f"{workflow['suite_url']}/save")
+        assert response.status_code == 200
+
+    def test_get_suite_info(self, workflow):
+        """Test retrieving the suite info."""
+        response = workflow["client"].get(workflow["suite_url"])
+        assert response.status_code == 200
+        suite_data = response.json()
         assert suite_data["name"] == "integration-suite"
         assert "python-context" in suite_data["contexts"]
 
-        # 7. List suites
-        list_response = client.get("/api/v1/suites/")
-        assert list_response.status_code == 200
-        assert list_response.json()["total"] == 1
+    def test_list_suites(self, workflow):
+        """Test listing suites."""
+        response = workflow["client"].get(self._SUITES_URL)
+        assert response.status_code == 200
+        assert response.json()["total"] == 1
 
-        # 8. Delete suite
-        delete_response = client.delete(f"/api/v1/suites/{suite_id}")
+    def test_delete_suite(self, workflow):
+        """Test deleting the suite and verifying it is gone."""
+        client = workflow["client"]
+        delete_response = client.delete(workflow["suite_url"])
         assert delete_response.status_code == 200
 
-        # 9. Verify deletion
-        final_list_response = client.get("/api/v1/suites/")
+        final_list_response = client.get(self._SUITES_URL)
         assert final_list_response.status_code == 200
         assert final_list_response.json()["total"] == 0
@@ -2,33 +2,162 @@
 Comprehensive tests for versions router functionality.
 """
 
-from unittest.mock import Mock, patch
+import asyncio
+import json
+from unittest.mock import Mock
 
 import pytest
-from fastapi.testclient import TestClient
 
-from rez_proxy.main import create_app
+from rez_proxy.core import rez_imports
+from rez_proxy.core.rez_imports import RezImportError
+from rez_proxy.routers import versions
+from rez_proxy.routers.versions import (
+    RequirementRequest,
+    VersionCompareRequest,
+    VersionRequest,
+)
+
+# Request bodies serialized once and posted as raw content
+_JSON_HEADERS = {"content-type": "application/json"}
+_PARSE_BODY = b'{"version": "1.2.3"}'
+_COMPARE_BODY = b'{"version1": "1.2.3", "version2": "1.2.4"}'
+_REQUIREMENT_BODY = b'{"requirement": "python>=3.8"}'
+
+# Built once and reset for each test instead of patching in a fresh mock
+_REZ_API_MOCK = Mock(spec=["create_version", "create_requirement", "iter_packages"])
+
+
+@pytest.fixture(autouse=True)
+def rez_api_mock(monkeypatch):
+    """Mock Rez for every test: the router's ``rez_api`` and the import check.
+
+    Tests configure the returned mock's ``return_value``/``side_effect``. The
+    reset also clears the recorded calls, which no test asserts on.
+    """
+    _REZ_API_MOCK.reset_mock(return_value=True, side_effect=True)
+    monkeypatch.setattr(versions, "rez_api", _REZ_API_MOCK)
+    monkeypatch.setattr(rez_imports, "safe_rez_import", lambda *args, **kwargs: True)
+    return _REZ_API_MOCK
+
+
+def _build_version():
+    """Build a version mock with the dunders the router uses attached."""
+    version = Mock(spec=["__str__", "__lt__", "__gt__", "tokens", "name"])
+    version.__str__ = Mock()
+    version.__lt__ = Mock()
+    version.__gt__ = Mock()
+    return version
+
+
+def _build_requirement():
+    """Build a requirement mock with a range supporting ``str`` and ``in``."""
+    requirement = Mock(spec=["__str__", "name", "range"])
+    requirement.__str__ = Mock()
+    requirement.range = Mock(spec=["__str__", "__contains__"])
+    requirement.range.__str__ = Mock()
+    requirement.range.__contains__ = Mock()
+    return requirement
+
+
+# Templates built once and reset for each test; copy.copy would share their
+# dunder mocks between copies
+_VERSION_TEMPLATES = (_build_version(), _build_version())
+_REQUIREMENT_TEMPLATE = _build_requirement()
+_REQUIREMENT_RANGE = _REQUIREMENT_TEMPLATE.range
+
+
+@pytest.fixture
+def mock_versions():
+    """Reset the two version templates to defaults and return them."""
+    for version in _VERSION_TEMPLATES:
+        version.reset_mock()
+        version.__str__.return_value = ""
+        version.__lt__.return_value = False
+        version.__gt__.return_value = False
+        version.tokens = []
+        version.name = ""
+    return _VERSION_TEMPLATES
+
+
+@pytest.fixture
+def mock_requirement():
+    """Reset the requirement template to defaults and return it."""
+    _REQUIREMENT_TEMPLATE.reset_mock()
+    _REQUIREMENT_TEMPLATE.__str__.return_value = ""
+    _REQUIREMENT_TEMPLATE.name = ""
+    _REQUIREMENT_TEMPLATE.range = _REQUIREMENT_RANGE
+    _REQUIREMENT_RANGE.__str__.return_value = ""
+    _REQUIREMENT_RANGE.__contains__.return_value = False
+    return _REQUIREMENT_TEMPLATE
+
+
+async def _asgi_request(app, method, path, query_string=b"", body=b""):
+    """Send one request straight to the ASGI app, skipping the HTTP client.
+
+    Returns the response status and decoded JSON body.
+    """
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": method,
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode(),
+        "root_path": "",
+        "query_string": query_string,
+        "headers": [
+            (b"host", b"testserver"),
+            (b"content-type", b"application/json"),
+            (b"content-length", str(len(body)).encode()),
+        ],
+        "client": ("testclient", 50000),
+        "server": ("testserver", 80),
+    }
+    messages = []
+    response_complete = asyncio.Event()
+    request_sent = False
+
+    async def receive():
+        nonlocal request_sent
+        if not request_sent:
+            request_sent = True
+            return {"type": "http.request", "body": body, "more_body": False}
+        await response_complete.wait()
+        return {"type": "http.disconnect"}
+
+    async def send(message):
+        messages.append(message)
+        if message["type"] == "http.response.body" and not message.get("more_body"):
+            response_complete.set()
+
+    await app(scope, receive, send)
+
+    status = next(m["status"] for m in messages if m["type"] == "http.response.start")
+    content = b"".join(
+        m.get("body", b"") for m in messages if m["type"] == "http.response.body"
+    )
+    return status, json.loads(content)
 
 
 class TestVersionsRouterComprehensive:
-    """Comprehensive test cases for versions router endpoints."""
+    """Comprehensive test cases for versions router endpoints.
 
-    @pytest.fixture
-    def client(self):
-        """Create test client."""
-        app = create_app()
-        return TestClient(app)
+    Each endpoint keeps at least one test through the client for routing and
+    request validation; the remaining cases await the handlers directly.
+    """
 
-    @patch("rez_proxy.core.rez_imports.rez_api")
-    def test_parse_version_success(self, mock_rez_api, client):
+    def test_parse_version_success(self, rez_api_mock, mock_versions, client):
         """Test successful version parsing."""
         # Mock version object
-        mock_version = Mock()
-        mock_version.__str__ = Mock(return_value="1.2.3")
+        mock_version = mock_versions[0]
+        mock_version.__str__.return_value = "1.2.3"
         mock_version.tokens = [1, 2, 3]
-        mock_rez_api.create_version.return_value = mock_version
+        rez_api_mock.create_version.return_value = mock_version
 
-        response = client.post("/api/v1/versions/parse", json={"version": "1.2.3"})
+        response = client.post(
+            "/api/v1/versions/parse", content=_PARSE_BODY, headers=_JSON_HEADERS
+        )
 
         assert response.status_code == 200
         data = response.json()
@@ -36,148 +165,77 @@ class TestVersionsRouterComprehensive:
         assert data["tokens"] == ["1", "2", "3"]
         assert data["is_valid"] is True
 
-    @patch("rez_proxy.core.rez_imports.rez_api")
-    def test_parse_version_invalid(self, mock_rez_api, client):
+    @pytest.mark.asyncio
+    async def test_parse_version_invalid(self, rez_api_mock):
         """Test parsing invalid version."""
-        mock_rez_api.create_version.side_effect = Exception("Invalid version")
-
-        response = client.post("/api/v1/versions/parse", json={"version": "invalid"})
-
-        assert response.status_code == 200
-        data = response.json()
-        assert data["version"] == "invalid"
-        assert data["tokens"] == []
-        assert data["is_valid"] is False
-
-    @patch("rez_proxy.core.rez_imports.safe_rez_import")
-    def test_parse_version_attribute_error(self, mock_safe_rez_import, client):
-        """Test version parsing with AttributeError."""
-        from rez_proxy.core.rez_imports import RezImportError
-
-        mock_safe_rez_import.side_effect = RezImportError("Rez is not available")
-
-        response = client.post("/api/v1/versions/parse", json={"version": "1.2.3"})
-
-        assert response.status_code == 503
-        assert "Rez is not available" in response.json()["detail"]
-
-    @patch("rez_proxy.core.rez_imports.rez_api")
-    def test_compare_versions_success(self, mock_rez_api, client):
-        """Test successful version comparison."""
-        # Mock version objects
-        mock_v1 = Mock()
-        mock_v1.__str__ = Mock(return_value="1.2.3")
-        mock_v1.__lt__ = Mock(return_value=True)
-        mock_v1.__gt__ = Mock(return_value=False)
-
-        mock_v2 = Mock()
-        mock_v2.__str__ = Mock(return_value="1.2.4")
-
-        mock_rez_api.create_version.side_effect = [mock_v1, mock_v2]
-
-        response = client.post(
-            "/api/v1/versions/compare", json={"version1": "1.2.3", "version2": "1.2.4"}
-        )
-
-        assert response.status_code == 200
-        data = response.json()
-        assert data["version1"] == "1.2.3"
-        assert data["version2"] == "1.2.4"
-        assert data["comparison"] == -1
-        assert data["equal"] is False
-        assert data["less_than"] is True
-        assert data["greater_than"] is False
-
-    @patch("rez_proxy.core.rez_imports.rez_api")
-    def test_compare_versions_equal(self, mock_rez_api, client):
-        """Test version comparison with equal versions."""
-        # Mock equal version objects
-        mock_v1 = Mock()
-        mock_v1.__str__ = Mock(return_value="1.2.3")
-        mock_v1.__lt__ = Mock(return_value=False)
-        mock_v1.__gt__ = Mock(return_value=False)
-
-        mock_v2 = Mock()
-        mock_v2.__str__ = Mock(return_value="1.2.3")
-
-        mock_rez_api.create_version.side_effect = [mock_v1, mock_v2]
-
-        response = client.post(
-            "/api/v1/versions/compare", json={"version1": "1.2.3", "version2": "1.2.3"}
-        )
-
-        assert response.status_code == 200
-        data = response.json()
-        assert data["comparison"] == 0
-        assert data["equal"] is True
-        assert data["less_than"] is False
-        assert data["greater_than"] is False
-
-    @patch("rez_proxy.core.rez_imports.rez_api")
-    def test_compare_versions_greater(self, mock_rez_api, client):
-        """Test version comparison with first version greater."""
+        rez_api_mock.create_version.side_effect = Exception("Invalid version")
+
+        result = await versions.parse_version(VersionRequest(version="invalid"))
+
+        assert result.version == "invalid"
+        assert result.tokens == []
+        assert result.is_valid is False
+
+    @pytest.mark.parametrize(
+        "version1,version2,lt,gt,comparison",
+        [
+            ("1.2.3", "1.2.4", True, False, -1),
+            ("1.2.3", "1.2.3", False, False, 0),
+            ("1.2.4", "1.2.3", False, True, 1),
+        ],
+        ids=["less", "equal", "greater"],
+    )
+    @pytest.mark.asyncio
+    async def test_compare_versions(
+        self, rez_api_mock, mock_versions, version1, version2, lt, gt, comparison
+    ):
+        """Test version comparison results."""
         # Mock version objects
-        mock_v1 = Mock()
-        mock_v1.__str__ = Mock(return_value="1.2.4")
-        mock_v1.__lt__ = Mock(return_value=False)
-        mock_v1.__gt__ = Mock(return_value=True)
-
-        mock_v2 = Mock()
-        mock_v2.__str__ = Mock(return_value="1.2.3")
-
-        mock_rez_api.create_version.side_effect = [mock_v1, mock_v2]
-
-        response = client.post(
-            "/api/v1/versions/compare", json={"version1": "1.2.4", "version2": "1.2.3"}
-        )
-
-        assert response.status_code == 200
-        data = response.json()
-        assert data["comparison"] == 1
-        assert data["equal"] is False
-        assert data["less_than"] is False
-        assert data["greater_than"] is True
-
-    @patch("rez_proxy.core.rez_imports.safe_rez_import")
-    def test_compare_versions_attribute_error(self, mock_safe_rez_import, client):
-        """Test version comparison with AttributeError."""
-        from rez_proxy.core.rez_imports import RezImportError
+        mock_v1, mock_v2 = mock_versions
+        mock_v1.__str__.return_value = version1
+        mock_v1.__lt__.return_value = lt
+        mock_v1.__gt__.return_value = gt
+        mock_v2.__str__.return_value = version2
 
-        mock_safe_rez_import.side_effect = RezImportError("Rez is not available")
+        rez_api_mock.create_version.side_effect = [mock_v1, mock_v2]
 
-        response = client.post(
-            "/api/v1/versions/compare", json={"version1": "1.2.3", "version2": "1.2.4"}
+        result = await versions.compare_versions(
+            VersionCompareRequest(version1=version1, version2=version2)
         )
 
-        assert response.status_code == 503
-        assert "Rez is not available" in response.json()["detail"]
+        assert result.version1 == version1
+        assert result.version2 == version2
+        assert result.comparison == comparison
+        assert result.equal is (comparison == 0)
+        assert result.less_than is (comparison == -1)
+        assert result.greater_than is (comparison == 1)
 
-    @patch("rez_proxy.core.rez_imports.rez_api")
-    def test_compare_versions_general_error(self, mock_rez_api, client):
+    def test_compare_versions_general_error(self, rez_api_mock, client):
         """Test version comparison with general error."""
-        mock_rez_api.create_version.side_effect = Exception("Version error")
+        rez_api_mock.create_version.side_effect = Exception("Version error")
 
         response = client.post(
             "/api/v1/versions/compare",
-            json={"version1": "invalid1", "version2": "invalid2"},
+            content=b'{"version1": "invalid1", "version2": "invalid2"}',
+            headers=_JSON_HEADERS,
         )
 
         assert response.status_code == 400
         assert "Failed to compare versions" in response.json()["detail"]
 
-    @patch("rez_proxy.core.rez_imports.rez_api")
-    def test_parse_requirement_success(self, mock_rez_api, client):
+    def test_parse_requirement_success(self, rez_api_mock, mock_requirement, client):
         """Test successful requirement parsing."""
         # Mock requirement object - Rez uses different format
-        mock_req = Mock()
-        mock_req.__str__ = Mock(return_value="python-3.8+")  # Rez format
+        mock_req = mock_requirement
+        mock_req.__str__.return_value = "python-3.8+"  # Rez format
         mock_req.name = "python"
-        mock_req.range = Mock()
-        mock_req.range.__str__ = Mock(return_value="3.8+")  # Rez format
-        mock_rez_api.create_requirement.return_value = mock_req
+        mock_req.range.__str__.return_value = "3.8+"  # Rez format
+        rez_api_mock.create_requirement.return_value = mock_req
 
         response = client.post(
-            "/api/v1/versions/requirements/parse", json={"requirement": "python>=3.8"}
+            "/api/v1/versions/requirements/parse",
+            content=_REQUIREMENT_BODY,
+            headers=_JSON_HEADERS,
         )
 
         assert response.status_code == 200
@@ -187,75 +245,55 @@ class TestVersionsRouterComprehensive:
         assert data["range"] == "3.8+"  # Rez format
         assert data["is_valid"] is True
 
-    @patch("rez_proxy.core.rez_imports.rez_api")
-    def test_parse_requirement_no_range(self, mock_rez_api, client):
+    @pytest.mark.asyncio
+    async def test_parse_requirement_no_range(self, rez_api_mock, mock_requirement):
         """Test requirement parsing without range."""
         # Mock requirement object without range
-        mock_req = Mock()
-        mock_req.__str__ = Mock(return_value="python")
+        mock_req = mock_requirement
+        mock_req.__str__.return_value = "python"
         mock_req.name = "python"
         mock_req.range = None
-        mock_rez_api.create_requirement.return_value = mock_req
+        rez_api_mock.create_requirement.return_value = mock_req
 
-        response = client.post(
-            "/api/v1/versions/requirements/parse", json={"requirement": "python"}
+        result = await versions.parse_requirement(
+            RequirementRequest(requirement="python")
         )
 
-        assert response.status_code == 200
-        data = response.json()
-        assert data["requirement"] == "python"
-        assert data["name"] == "python"
-        assert data["range"] is None
-        assert data["is_valid"] is True
+        assert result.requirement == "python"
+        assert result.name == "python"
+        assert result.range is None
+        assert result.is_valid is True
 
-    @patch("rez_proxy.core.rez_imports.rez_api")
-    def test_parse_requirement_invalid(self, mock_rez_api, client):
+    @pytest.mark.asyncio
+    async def test_parse_requirement_invalid(self, rez_api_mock):
         """Test parsing invalid requirement."""
-        mock_rez_api.create_requirement.side_effect = Exception("Invalid requirement")
+        rez_api_mock.create_requirement.side_effect = Exception("Invalid requirement")
 
-        response = client.post(
-            "/api/v1/versions/requirements/parse",
-            json={"requirement": "invalid-requirement"},
+        result = await versions.parse_requirement(
+            RequirementRequest(requirement="invalid-requirement")
         )
 
-        assert response.status_code == 200
-        data = response.json()
-        assert data["requirement"] == "invalid-requirement"
-        assert data["name"] == ""
-        assert data["range"] is None
-        assert data["is_valid"] is False
-
-    @patch("rez_proxy.core.rez_imports.safe_rez_import")
-    def test_parse_requirement_attribute_error(self, mock_safe_rez_import, client):
-        """Test requirement parsing with AttributeError."""
-        from rez_proxy.core.rez_imports import RezImportError
-
-        mock_safe_rez_import.side_effect = RezImportError("Rez is not available")
-
-        response = client.post(
-            "/api/v1/versions/requirements/parse", json={"requirement": "python>=3.8"}
-        )
+        assert result.requirement == "invalid-requirement"
+        assert result.name == ""
+        assert result.range is None
+        assert result.is_valid is False
 
-        assert response.status_code == 503
-        assert "Rez is not available" in response.json()["detail"]
-
-    @patch("rez_proxy.core.rez_imports.rez_api")
-    def test_check_requirement_satisfaction_success(self, mock_rez_api, client):
+    def test_check_requirement_satisfaction_success(
+        self, rez_api_mock, mock_requirement, mock_versions, client
+    ):
         """Test successful requirement satisfaction check."""
         # Mock requirement and version objects
-        mock_req = Mock()
-        mock_req.__str__ = Mock(return_value="python-3.8+")  # Rez format
-        mock_req.range = Mock()
+        mock_req = mock_requirement
+        mock_req.__str__.return_value = "python-3.8+"  # Rez format
 
-        mock_ver = Mock()
-        mock_ver.__str__ = Mock(return_value="3.9.0")
-        mock_ver.__contains__ = Mock(return_value=True)
+        mock_ver = mock_versions[0]
+        mock_ver.__str__.return_value = "3.9.0"
 
         # Mock the 'in' operator for version in range
-        mock_req.range.__contains__ = Mock(return_value=True)
+        mock_req.range.__contains__.return_value = True
 
-        mock_rez_api.create_requirement.return_value = mock_req
-        mock_rez_api.create_version.return_value = mock_ver
+        rez_api_mock.create_requirement.return_value = mock_req
+        rez_api_mock.create_version.return_value = mock_ver
 
         response = client.post(
             "/api/v1/versions/requirements/check",
@@ -268,54 +306,37 @@ class TestVersionsRouterComprehensive:
         assert data["version"] == "3.9.0"
         assert data["satisfies"] is True
 
-    @patch("rez_proxy.core.rez_imports.rez_api")
-    def test_check_requirement_satisfaction_no_range(self, mock_rez_api, client):
+    @pytest.mark.asyncio
+    async def test_check_requirement_satisfaction_no_range(
+        self, rez_api_mock, mock_requirement, mock_versions
+    ):
         """Test requirement satisfaction check without range."""
         # Mock requirement and version objects
-        mock_req = Mock()
-        mock_req.__str__ = Mock(return_value="python")
+        mock_req = mock_requirement
+        mock_req.__str__.return_value = "python"
         mock_req.name = "python"
         mock_req.range = None
 
-        mock_ver = Mock()
-        mock_ver.__str__ = Mock(return_value="3.9.0")
+        mock_ver = mock_versions[0]
+        mock_ver.__str__.return_value = "3.9.0"
         mock_ver.name = "python"
 
-        mock_rez_api.create_requirement.return_value = mock_req
-        mock_rez_api.create_version.return_value = mock_ver
+        rez_api_mock.create_requirement.return_value = mock_req
+        rez_api_mock.create_version.return_value = mock_ver
 
-        response = client.post(
-            "/api/v1/versions/requirements/check",
-            params={"requirement": "python", "version": "3.9.0"},
+        result = await versions.check_requirement_satisfaction(
+            requirement="python", version="3.9.0"
         )
 
-        assert response.status_code == 200
-        data = response.json()
-        assert data["requirement"] == "python"
-        assert data["version"] == "3.9.0"
-        assert data["satisfies"] is True
+        assert result == {
+            "requirement": "python",
+            "version": "3.9.0",
+            "satisfies": True,
+        }
 
-    @patch("rez_proxy.core.rez_imports.safe_rez_import")
-    def test_check_requirement_satisfaction_attribute_error(
-        self, mock_safe_rez_import, client
-    ):
-        """Test requirement satisfaction check with AttributeError."""
-        from rez_proxy.core.rez_imports import RezImportError
-
-        mock_safe_rez_import.side_effect = RezImportError("Rez is not available")
-
-        response = client.post(
-            "/api/v1/versions/requirements/check",
-            params={"requirement": "python>=3.8", "version": "3.9.0"},
-        )
-
-        assert response.status_code == 503
-        assert "Rez is not available" in response.json()["detail"]
-
-    @patch("rez_proxy.core.rez_imports.rez_api")
-    def test_check_requirement_satisfaction_general_error(self, mock_rez_api, client):
+    def test_check_requirement_satisfaction_general_error(self, rez_api_mock, client):
         """Test requirement satisfaction check with general error."""
-        mock_rez_api.create_requirement.side_effect = Exception("Requirement error")
+        rez_api_mock.create_requirement.side_effect = Exception("Requirement error")
 
         response = client.post(
             "/api/v1/versions/requirements/check",
@@ -325,17 +346,14 @@ class TestVersionsRouterComprehensive:
         assert response.status_code == 400
         assert "Failed to check requirement" in response.json()["detail"]
 
-    @patch("rez_proxy.core.rez_imports.rez_api")
-    def test_get_latest_versions_success(self, mock_rez_api, client):
+    def test_get_latest_versions_success(self, rez_api_mock, mock_versions, client):
         """Test successful latest versions retrieval."""
         # Mock package objects
-        mock_package1 = Mock()
-        mock_package1.version = Mock()
-        mock_package1.version.__str__ = Mock(return_value="3.9.0")
-
-        mock_package2 = Mock()
-        mock_package2.version = Mock()
-        mock_package2.version.__str__ = Mock(return_value="1.21.0")
+        mock_v1, mock_v2 = mock_versions
+        mock_v1.__str__.return_value = "3.9.0"
+        mock_v2.__str__.return_value = "1.21.0"
+        mock_package1 = Mock(version=mock_v1)
+        mock_package2 = Mock(version=mock_v2)
 
         def mock_iter_packages(name):
             if name == "python":
@@ -344,11 +362,12 @@ class TestVersionsRouterComprehensive:
                 return [mock_package2]
             return []
 
-        mock_rez_api.iter_packages.side_effect = mock_iter_packages
+        rez_api_mock.iter_packages.side_effect = mock_iter_packages
 
         # Use correct query parameter format for list
         response = client.get(
-            "/api/v1/versions/latest?packages=python&packages=numpy&limit=10"
+            "/api/v1/versions/latest",
+            params={"packages": ["python", "numpy"], "limit": 10},
         )
 
         assert response.status_code == 200
@@ -357,51 +376,71 @@ class TestVersionsRouterComprehensive:
         assert data["latest_versions"]["python"] == "3.9.0"
         assert data["latest_versions"]["numpy"] == "1.21.0"
 
-    @patch("rez_proxy.core.rez_imports.rez_api")
-    def test_get_latest_versions_no_packages(self, mock_rez_api, client):
+    @pytest.mark.asyncio
+    async def test_get_latest_versions_no_packages(self, rez_api_mock):
         """Test latest versions with no packages found."""
-        mock_rez_api.iter_packages.return_value = []
-
-        response = client.get("/api/v1/versions/latest?packages=nonexistent&limit=10")
+        rez_api_mock.iter_packages.return_value = []
 
-        assert response.status_code == 200
-        data = response.json()
-        assert "latest_versions" in data
-        assert data["latest_versions"]["nonexistent"] is None
-
-    @patch("rez_proxy.core.rez_imports.safe_rez_import")
-    def test_get_latest_versions_attribute_error(self, mock_safe_rez_import, client):
-        """Test latest versions with AttributeError."""
-        from rez_proxy.core.rez_imports import RezImportError
-
-        mock_safe_rez_import.side_effect = RezImportError("Rez is not available")
+        result = await versions.get_latest_versions(packages=["nonexistent"], limit=10)
 
-        response = client.get("/api/v1/versions/latest?packages=python&limit=10")
+        assert result == {"latest_versions": {"nonexistent": None}}
 
-        assert response.status_code == 503
-        assert "Rez is not available" in response.json()["detail"]
+    def test_get_latest_versions_package_error(self, rez_api_mock, client):
+        """Test that a failing package lookup reports no latest version."""
+        rez_api_mock.iter_packages.side_effect = Exception("Package error")
 
-    @patch("rez_proxy.core.rez_imports.rez_api")
-    def test_get_latest_versions_general_error(self, mock_rez_api, client):
-        """Test latest versions with general error."""
-        mock_rez_api.iter_packages.side_effect = Exception("Package error")
+        response = client.get(
+            "/api/v1/versions/latest", params={"packages": ["python"], "limit": 10}
+        )
 
-        response = client.get("/api/v1/versions/latest?packages=python&limit=10")
+        assert response.status_code == 200
+        assert response.json() == {"latest_versions": {"python": None}}
+
+    @pytest.mark.parametrize(
+        "path,body",
+        [
+            ("/api/v1/versions/parse", b"{}"),
+            ("/api/v1/versions/compare", b'{"version1": "1.2.3"}'),
+            ("/api/v1/versions/requirements/parse", b"{}"),
+        ],
+        ids=["parse", "compare", "requirement-parse"],
+    )
+    @pytest.mark.asyncio
+    async def test_validation_error(self, client, path, body):
+        """Test that requests missing required fields are rejected."""
+        status, _ = await _asgi_request(client.app, "POST", path, body=body)
+        assert status == 422
+
+    @pytest.mark.parametrize(
+        "method,path,query_string,body",
+        [
+            ("POST", "/api/v1/versions/parse", b"", _PARSE_BODY),
+            ("POST", "/api/v1/versions/compare", b"", _COMPARE_BODY),
+            ("POST", "/api/v1/versions/requirements/parse", b"", _REQUIREMENT_BODY),
+            (
+                "POST",
+                "/api/v1/versions/requirements/check",
+                b"requirement=python%3E%3D3.8&version=3.9.0",
+                b"",
+            ),
+            ("GET", "/api/v1/versions/latest", b"packages=python&limit=10", b""),
+        ],
+        ids=["parse", "compare", "requirement-parse", "requirement-check", "latest"],
+    )
+    @pytest.mark.asyncio
+    async def test_rez_unavailable_returns_503(
+        self, monkeypatch, client, method, path, query_string, body
+    ):
+        """Test that endpoints return 503 when Rez cannot be imported."""
 
-        assert response.status_code == 500
-        assert "Failed to get latest versions" in response.json()["detail"]
+        def rez_unavailable(*args, **kwargs):
+            raise RezImportError("Rez is not available")
 
-    def test_parse_version_validation_error(self, client):
-        """Test version parsing with validation error."""
-        response = client.post("/api/v1/versions/parse", json={})
-        assert response.status_code == 422
+        monkeypatch.setattr(rez_imports, "safe_rez_import", rez_unavailable)
 
-    def test_compare_versions_validation_error(self, client):
-        """Test version comparison with validation error."""
-        response = client.post("/api/v1/versions/compare", json={"version1": "1.2.3"})
-        assert response.status_code == 422
+        status, data = await _asgi_request(
+            client.app, method, path, query_string=query_string, body=body
+        )
 
-    def test_parse_requirement_validation_error(self, client):
-        """Test requirement parsing with validation error."""
-        response = client.post("/api/v1/versions/requirements/parse", json={})
-        assert response.status_code == 422
+        assert status == 503
+        assert "Rez is not available" in data["detail"]
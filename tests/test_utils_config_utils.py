@@ -4,10 +4,13 @@ Tests for rez_proxy.utils.config_utils module.
 
 import json
 import os
+import stat
+import sys
 from unittest.mock import Mock, patch
 
-from pyfakefs.fake_filesystem_unittest import TestCase
+import pytest
 
+from rez_proxy.utils import config_utils
 from rez_proxy.utils.config_utils import (
     apply_config_template,
     backup_config_file,
@@ -18,136 +21,148 @@ from rez_proxy.utils.config_utils import (
     validate_config_file,
     validate_config_file_data,
     watch_config_changes,
+    watch_config_changes_v2,
 )
 
+_CFG_BASIC_DATA = {"host": "localhost", "port": 8000}
+_CFG_BASIC = json.dumps(_CFG_BASIC_DATA)
 
-class TestCreateDefaultConfigFile(TestCase):
-    """Test create_default_config_file function."""
 
-    def setUp(self):
-        """Set up test environment."""
-        self.setUpPyfakefs()
+class TestCreateDefaultConfigFile:
+    """Test create_default_config_file function."""
 
-    def test_create_default_config_file_success(self):
+    def test_create_default_config_file_success(self, tmp_path):
         """Test creating default config file successfully."""
-        config_path = "/test/config.json"
+        config_path = tmp_path / "config.json"
 
         with patch("builtins.print") as mock_print:
-            create_default_config_file(config_path)
+            create_default_config_file(str(config_path))
 
         # Check file was created
-        self.assertTrue(os.path.exists(config_path))
+        assert config_path.exists()
 
         # Check file content
-        with open(config_path) as f:
-            config_data = json.load(f)
+        config_data = json.loads(config_path.read_text())
 
         # Should contain basic config fields but not sensitive ones
-        self.assertIn("host", config_data)
-        self.assertIn("port", config_data)
-        self.assertNotIn("api_key", config_data)
+        assert "host" in config_data
+        assert "port" in config_data
+        assert "api_key" not in config_data
 
         # Check print was called
         mock_print.assert_called_once()
 
-    def test_create_default_config_file_creates_directory(self):
+    def test_create_default_config_file_creates_directory(self, tmp_path):
         """Test creating config file creates parent directories."""
-        config_path = "/test/nested/dir/config.json"
+        config_path = tmp_path / "nested" / "dir" / "config.json"
 
-        create_default_config_file(config_path)
+        create_default_config_file(str(config_path))
 
         # Check directory was created
-        self.assertTrue(os.path.exists("/test/nested/dir"))
-        self.assertTrue(os.path.exists(config_path))
+        assert (tmp_path / "nested" / "dir").exists()
+        assert config_path.exists()
 
-    def test_create_default_config_file_no_directory(self):
+    def test_create_default_config_file_no_directory(self, tmp_path, monkeypatch):
         """Test creating config file in current directory."""
-        config_path = "config.json"
+        monkeypatch.chdir(tmp_path)
 
-        create_default_config_file(config_path)
+        create_default_config_file("config.json")
 
-        self.assertTrue(os.path.exists(config_path))
+        assert (tmp_path / "config.json").exists()
 
 
-class TestValidateConfigFile(TestCase):
+class TestValidateConfigFile:
     """Test validate_config_file function."""
 
-    def setUp(self):
-        """Set up test environment."""
-        self.setUpPyfakefs()
+    @pytest.fixture(scope="class")
+    def config_dir(self, tmp_path_factory):
+        """Create one directory shared by the tests in this class."""
+        return tmp_path_factory.mktemp("validate_config_file")
 
-    def test_validate_config_file_not_found(self):
+    @pytest.fixture
+    def config_path(self, config_dir, request):
+        """Return a config path unique to the test within the shared directory."""
+        return config_dir / f"{request.node.name}.json"
+
+    def test_validate_config_file_not_found(self, config_dir):
         """Test validation when config file doesn't exist."""
-        result = validate_config_file("/nonexistent/config.json")
+        result = validate_config_file(str(config_dir / "nonexistent" / "config.json"))
 
-        self.assertFalse(result["valid"])
-        self.assertIn("Configuration file not found", result["errors"][0])
-        self.assertEqual(result["config"], None)
+        assert not result["valid"]
+        assert "Configuration file not found" in result["errors"][0]
+        assert result["config"] is None
 
-    def test_validate_config_file_invalid_json(self):
+    def test_validate_config_file_invalid_json(self, config_path):
         """Test validation with invalid JSON."""
-        config_path = "/test/config.json"
-        self.fs.create_file(config_path, contents="invalid json {")
+        config_path.write_text("invalid json {")
 
-        result = validate_config_file(config_path)
+        result = validate_config_file(str(config_path))
 
-        self.assertFalse(result["valid"])
-        self.assertIn("Invalid JSON format", result["errors"][0])
+        assert not result["valid"]
+        assert "Invalid JSON format" in result["errors"][0]
 
-    def test_validate_config_file_valid_config(self):
+    def test_validate_config_file_valid_config(self, config_path):
         """Test validation with valid configuration."""
-        config_path = "/test/config.json"
         valid_config = {"host": "localhost", "port": 8000, "api_prefix": "/api"}
-        self.fs.create_file(config_path, contents=json.dumps(valid_config))
+        config_path.write_text(json.dumps(valid_config))
 
-        result = validate_config_file(config_path)
+        result = validate_config_file(str(config_path))
 
-        self.assertTrue(result["valid"])
-        self.assertEqual(len(result["errors"]), 0)
-        self.assertIsNotNone(result["config"])
+        assert result["valid"]
+        assert len(result["errors"]) == 0
+        assert result["config"] is not None
 
-    def test_validate_config_file_unknown_fields(self):
+    def test_validate_config_file_unknown_fields(self, config_path):
         """Test validation with unknown fields."""
-        config_path = "/test/config.json"
         config_with_unknown = {
             "host": "localhost",
             "port": 8000,
             "unknown_field": "value",
         }
-        self.fs.create_file(config_path, contents=json.dumps(config_with_unknown))
+        config_path.write_text(json.dumps(config_with_unknown))
 
-        result = validate_config_file(config_path)
+        result = validate_config_file(str(config_path))
 
-        self.assertTrue(result["valid"])
-        self.assertIn("Unknown configuration fields", result["warnings"][0])
+        assert result["valid"]
+        assert "Unknown configuration fields" in result["warnings"][0]
 
-    def test_validate_config_file_missing_important_fields(self):
+    def test_validate_config_file_missing_important_fields(self, config_path):
         """Test validation with missing important fields."""
-        config_path = "/test/config.json"
         minimal_config = {"rez_debug": True}
-        self.fs.create_file(config_path, contents=json.dumps(minimal_config))
+        config_path.write_text(json.dumps(minimal_config))
 
-        result = validate_config_file(config_path)
+        result = validate_config_file(str(config_path))
 
-        self.assertTrue(result["valid"])
-        self.assertIn("Missing important fields", result["warnings"][0])
+        assert result["valid"]
+        assert "Missing important fields" in result["warnings"][0]
 
-    def test_validate_config_file_validation_error(self):
+    def test_validate_config_file_validation_error(self, config_path):
         """Test validation with schema validation error."""
-        config_path = "/test/config.json"
         invalid_config = {
             "host": "localhost",
             "port": "invalid_port",  # Should be integer
         }
-        self.fs.create_file(config_path, contents=json.dumps(invalid_config))
+        config_path.write_text(json.dumps(invalid_config))
+
+        result = validate_config_file(str(config_path))
 
-        result = validate_config_file(config_path)
+        assert not result["valid"]
+        assert "Configuration validation error" in result["errors"][0]
 
-        self.assertFalse(result["valid"])
-        self.assertIn("Configuration validation error", result["errors"][0])
+    def test_validate_config_file_reparses_after_change(self, config_path):
+        """Test that a rewritten file is validated with its new content."""
+        config_path.write_text(_CFG_BASIC)
+        assert validate_config_file(str(config_path))["config"]["port"] == 8000
 
+        # Same size and same mtime as before
+        mtime_ns = config_path.stat().st_mtime_ns
+        config_path.write_text(json.dumps({"host": "localhost", "port": 9000}))
+        os.utime(config_path, ns=(mtime_ns, mtime_ns))
 
-class TestValidateConfigFileData(TestCase):
+        assert validate_config_file(str(config_path))["config"]["port"] == 9000
+
+
+class TestValidateConfigFileData:
     """Test validate_config_file_data function."""
 
     def test_validate_config_file_data_valid(self):
@@ -156,9 +171,9 @@ class TestValidateConfigFileData(TestCase):
 
         result = validate_config_file_data(config_data)
 
-        self.assertTrue(result["valid"])
-        self.assertEqual(len(result["errors"]), 0)
-        self.assertIsNotNone(result["config"])
+        assert result["valid"]
+        assert len(result["errors"]) == 0
+        assert result["config"] is not None
 
     def test_validate_config_file_data_invalid(self):
         """Test validation with invalid config data."""
@@ -166,8 +181,8 @@ class TestValidateConfigFileData(TestCase):
 
         result = validate_config_file_data(config_data)
 
-        self.assertFalse(result["valid"])
-        self.assertIn("Configuration validation error", result["errors"][0])
+        assert not result["valid"]
+        assert "Configuration validation error" in result["errors"][0]
 
     def test_validate_config_file_data_unknown_fields(self):
         """Test validation with unknown fields."""
@@ -175,38 +190,33 @@ class TestValidateConfigFileData(TestCase):
 
         result = validate_config_file_data(config_data)
 
-        self.assertTrue(result["valid"])
-        self.assertIn("Unknown configuration fields", result["warnings"][0])
+        assert result["valid"]
+        assert "Unknown configuration fields" in result["warnings"][0]
 
 
-class TestMergeConfigFiles(TestCase):
+class TestMergeConfigFiles:
     """Test merge_config_files function."""
 
-    def setUp(self):
-        """Set up test environment."""
-        self.setUpPyfakefs()
-
-    def test_merge_config_files_success(self):
+    def test_merge_config_files_success(self, tmp_path):
         """Test successful config file merging."""
         base_config = {"host": "localhost", "port": 8000, "rez_debug": False}
         override_config = {"port": 9000, "rez_debug": True, "workers": 4}
 
-        base_path = "/test/base.json"
-        override_path = "/test/override.json"
-        output_path = "/test/merged.json"
+        base_path = tmp_path / "base.json"
+        override_path = tmp_path / "override.json"
+        output_path = tmp_path / "merged.json"
 
-        self.fs.create_file(base_path, contents=json.dumps(base_config))
-        self.fs.create_file(override_path, contents=json.dumps(override_config))
+        base_path.write_text(json.dumps(base_config))
+        override_path.write_text(json.dumps(override_config))
 
         with patch("builtins.print") as mock_print:
-            merge_config_files(base_path, override_path, output_path)
+            merge_config_files(str(base_path), str(override_path), str(output_path))
 
         # Check merged file was created
-        self.assertTrue(os.path.exists(output_path))
+        assert output_path.exists()
 
         # Check merged content
-        with open(output_path) as f:
-            merged_data = json.load(f)
+        merged_data = json.loads(output_path.read_text())
 
         expected = {
             "host": "localhost",  # from base
@@ -214,189 +224,273 @@ class TestMergeConfigFiles(TestCase):
             "rez_debug": True,  # overridden
             "workers": 4,  # added
         }
-        self.assertEqual(merged_data, expected)
+        assert merged_data == expected
         mock_print.assert_called_once()
 
-    def test_merge_config_files_invalid_result(self):
+    @pytest.mark.parametrize(
+        "use_orjson",
+        [
+            False,
+            pytest.param(
+                True,
+                marks=pytest.mark.skipif(
+                    not config_utils.ORJSON_AVAILABLE, reason="orjson not installed"
+                ),
+            ),
+        ],
+        ids=["json", "orjson"],
+    )
+    def test_merge_config_files_non_ascii(self, tmp_path, monkeypatch, use_orjson):
+        """Test that non-ASCII values are written as the same UTF-8 text."""
+        monkeypatch.setattr(config_utils, "ORJSON_AVAILABLE", use_orjson)
+        override_config = {"host": "h\u00e9llo.local"}
+
+        base_path = tmp_path / "base.json"
+        override_path = tmp_path / "override.json"
+        output_path = tmp_path / "merged.json"
+
+        base_path.write_text(_CFG_BASIC, encoding="utf-8")
+        override_path.write_text(json.dumps(override_config), encoding="utf-8")
+
+        with patch("builtins.print"):
+            merge_config_files(str(base_path), str(override_path), str(output_path))
+
+        expected = json.dumps(
+            {**_CFG_BASIC_DATA, **override_config}, indent=2, ensure_ascii=False
+        )
+        assert output_path.read_bytes() == expected.encode("utf-8")
+
+    def test_merge_config_files_invalid_result(self, tmp_path):
         """Test merging that results in invalid configuration."""
-        base_config = {"host": "localhost", "port": 8000}
         override_config = {"port": "invalid_port"}
 
-        base_path = "/test/base.json"
-        override_path = "/test/override.json"
-        output_path = "/test/merged.json"
+        base_path = tmp_path / "base.json"
+        override_path = tmp_path / "override.json"
+        output_path = tmp_path / "merged.json"
 
-        self.fs.create_file(base_path, contents=json.dumps(base_config))
-        self.fs.create_file(override_path, contents=json.dumps(override_config))
+        base_path.write_text(_CFG_BASIC)
+        override_path.write_text(json.dumps(override_config))
 
-        with self.assertRaises(ValueError) as cm:
-            merge_config_files(base_path, override_path, output_path)
+        with pytest.raises(ValueError, match="Merged configuration is invalid"):
+            merge_config_files(str(base_path), str(override_path), str(output_path))
 
-        self.assertIn("Merged configuration is invalid", str(cm.exception))
 
-
-class TestBackupConfigFile(TestCase):
+class TestBackupConfigFile:
     """Test backup_config_file function."""
 
-    def setUp(self):
-        """Set up test environment."""
-        self.setUpPyfakefs()
-
-    def test_backup_config_file_success(self):
+    def test_backup_config_file_success(self, tmp_path):
         """Test successful config file backup."""
-        config_path = "/test/config.json"
-        config_data = {"host": "localhost", "port": 8000}
-        self.fs.create_file(config_path, contents=json.dumps(config_data))
+        config_path = tmp_path / "config.json"
+        config_path.write_text(_CFG_BASIC)
 
         with patch("builtins.print") as mock_print:
-            backup_path = backup_config_file(config_path)
+            backup_path = backup_config_file(str(config_path))
 
-        expected_backup = config_path + ".backup"
-        self.assertEqual(backup_path, expected_backup)
-        self.assertTrue(os.path.exists(backup_path))
+        expected_backup = f"{config_path}.backup"
+        assert backup_path == expected_backup
+        assert (tmp_path / "config.json.backup").exists()
 
         # Check backup content matches original
         with open(backup_path) as f:
             backup_data = json.load(f)
-        self.assertEqual(backup_data, config_data)
+        assert backup_data == _CFG_BASIC_DATA
         mock_print.assert_called_once()
 
-    def test_backup_config_file_not_found(self):
+    def test_backup_config_file_not_found(self, tmp_path):
         """Test backup when config file doesn't exist."""
-        with self.assertRaises(FileNotFoundError) as cm:
-            backup_config_file("/nonexistent/config.json")
+        with pytest.raises(FileNotFoundError, match="Configuration file not found"):
+            backup_config_file(str(tmp_path / "nonexistent" / "config.json"))
 
-        self.assertIn("Configuration file not found", str(cm.exception))
-
-    def test_backup_config_file_existing_backup(self):
+    def test_backup_config_file_existing_backup(self, tmp_path):
         """Test backup when backup already exists."""
-        config_path = "/test/config.json"
-        backup_path = config_path + ".backup"
+        config_path = tmp_path / "config.json"
+        backup_path = tmp_path / "config.json.backup"
 
-        config_data = {"host": "localhost", "port": 8000}
-        self.fs.create_file(config_path, contents=json.dumps(config_data))
-        self.fs.create_file(backup_path, contents="existing backup")
+        config_path.write_text(_CFG_BASIC)
+        backup_path.write_text("existing backup")
 
         with patch("time.time", return_value=1234567890):
-            result_backup = backup_config_file(config_path)
+            result_backup = backup_config_file(str(config_path))
 
-        expected_backup = f"{config_path}.backup.1234567890"
-        self.assertEqual(result_backup, expected_backup)
-        self.assertTrue(os.path.exists(expected_backup))
+        expected_backup = tmp_path / "config.json.backup.1234567890"
+        assert result_backup == str(expected_backup)
+        assert expected_backup.exists()
 
-    def test_backup_config_file_custom_suffix(self):
+    def test_backup_config_file_custom_suffix(self, tmp_path):
         """Test backup with custom suffix."""
-        config_path = "/test/config.json"
-        config_data = {"host": "localhost", "port": 8000}
-        self.fs.create_file(config_path, contents=json.dumps(config_data))
+        config_path = tmp_path / "config.json"
+        config_path.write_text(_CFG_BASIC)
 
-        backup_path = backup_config_file(config_path, ".old")
+        backup_path = backup_config_file(str(config_path), ".old")
 
-        expected_backup = config_path + ".old"
-        self.assertEqual(backup_path, expected_backup)
-        self.assertTrue(os.path.exists(backup_path))
+        expected_backup = tmp_path / "config.json.old"
+        assert backup_path == str(expected_backup)
+        assert expected_backup.exists()
 
+    @pytest.mark.skipif(sys.platform == "win32", reason="POSIX permissions only")
+    def test_backup_config_file_preserves_permissions(self, tmp_path):
+        """Test that the backup keeps the source file's permission bits."""
+        config_path = tmp_path / "config.json"
+        config_path.write_text(_CFG_BASIC)
+        os.chmod(config_path, 0o600)
 
-class TestRestoreConfigFromBackup(TestCase):
-    """Test restore_config_from_backup function."""
+        with patch("builtins.print"):
+            backup_path = backup_config_file(str(config_path))
+
+        assert stat.S_IMODE(os.stat(backup_path).st_mode) == 0o600
 
-    def setUp(self):
-        """Set up test environment."""
-        self.setUpPyfakefs()
 
-    def test_restore_config_from_backup_success(self):
+class TestRestoreConfigFromBackup:
+    """Test restore_config_from_backup function."""
+
+    def test_restore_config_from_backup_success(self, tmp_path):
         """Test successful config restoration."""
-        backup_path = "/test/config.backup"
-        target_path = "/test/config.json"
+        backup_path = tmp_path / "config.backup"
+        target_path = tmp_path / "config.json"
 
-        backup_data = {"host": "localhost", "port": 8000}
-        self.fs.create_file(backup_path, contents=json.dumps(backup_data))
+        backup_path.write_text(_CFG_BASIC)
 
         with patch("builtins.print") as mock_print:
-            restore_config_from_backup(backup_path, target_path)
+            restore_config_from_backup(str(backup_path), str(target_path))
 
-        self.assertTrue(os.path.exists(target_path))
+        assert target_path.exists()
 
         # Check restored content
-        with open(target_path) as f:
-            restored_data = json.load(f)
-        self.assertEqual(restored_data, backup_data)
+        restored_data = json.loads(target_path.read_text())
+        assert restored_data == _CFG_BASIC_DATA
         mock_print.assert_called_once()
 
-    def test_restore_config_from_backup_not_found(self):
+    @pytest.mark.skipif(sys.platform == "win32", reason="POSIX permissions only")
+    def test_restore_config_from_backup_preserves_permissions(self, tmp_path):
+        """Test that the restored file gets the backup's permission bits."""
+        backup_path = tmp_path / "config.backup"
+        target_path = tmp_path / "config.json"
+        backup_path.write_text(_CFG_BASIC)
+        os.chmod(backup_path, 0o600)
+
+        with patch("builtins.print"):
+            restore_config_from_backup(str(backup_path), str(target_path))
+
+        assert stat.S_IMODE(os.stat(target_path).st_mode) == 0o600
+
+    @pytest.mark.parametrize(
+        "use_orjson",
+        [
+            False,
+            pytest.param(
+                True,
+                marks=pytest.mark.skipif(
+                    not config_utils.ORJSON_AVAILABLE, reason="orjson not installed"
+                ),
+            ),
+        ],
+        ids=["json", "orjson"],
+    )
+    def test_restore_config_from_backup_invalid_utf8(
+        self, tmp_path, monkeypatch, use_orjson
+    ):
+        """Test restoration with a backup that is not valid UTF-8."""
+        monkeypatch.setattr(config_utils, "ORJSON_AVAILABLE", use_orjson)
+        backup_path = tmp_path / "config.backup"
+        target_path = tmp_path / "config.json"
+        backup_path.write_bytes(b'{"host": "\xff"}')
+
+        with pytest.raises(ValueError, match="Backup configuration is invalid"):
+            restore_config_from_backup(str(backup_path), str(target_path))
+
+        assert not target_path.exists()
+
+    def test_restore_config_from_backup_not_found(self, tmp_path):
         """Test restoration when backup doesn't exist."""
-        with self.assertRaises(FileNotFoundError) as cm:
-            restore_config_from_backup("/nonexistent/backup", "/test/config.json")
+        with pytest.raises(FileNotFoundError, match="Backup file not found"):
+            restore_config_from_backup(
+                str(tmp_path / "nonexistent" / "backup"), str(tmp_path / "config.json")
+            )
 
-        self.assertIn("Backup file not found", str(cm.exception))
-
-    def test_restore_config_from_backup_invalid(self):
+    def test_restore_config_from_backup_invalid(self, tmp_path):
         """Test restoration with invalid backup."""
-        backup_path = "/test/config.backup"
-        target_path = "/test/config.json"
+        backup_path = tmp_path / "config.backup"
+        target_path = tmp_path / "config.json"
 
         # Create invalid backup
         invalid_backup = {"port": "invalid_port"}
-        self.fs.create_file(backup_path, contents=json.dumps(invalid_backup))
+        backup_path.write_text(json.dumps(invalid_backup))
 
-        with self.assertRaises(ValueError) as cm:
-            restore_config_from_backup(backup_path, target_path)
+        with pytest.raises(ValueError, match="Backup configuration is invalid"):
+            restore_config_from_backup(str(backup_path), str(target_path))
 
-        self.assertIn("Backup configuration is invalid", str(cm.exception))
+    def test_restore_config_from_backup_invalid_json(self, tmp_path):
+        """Test restoration with a backup that is not valid JSON."""
+        backup_path = tmp_path / "config.backup"
+        target_path = tmp_path / "config.json"
+        backup_path.write_text("{ invalid json")
 
+        with pytest.raises(ValueError, match="Invalid JSON format"):
+            restore_config_from_backup(str(backup_path), str(target_path))
 
-class TestGetConfigDiff(TestCase):
-    """Test get_config_diff function."""
+        assert not target_path.exists()
 
-    def setUp(self):
-        """Set up test environment."""
-        self.setUpPyfakefs()
 
-    def test_get_config_diff_success(self):
+class TestGetConfigDiff:
+    """Test get_config_diff function."""
+
+    def test_get_config_diff_success(self, tmp_path):
         """Test successful config diff."""
         config1 = {"host": "localhost", "port": 8000, "debug": False}
         config2 = {"host": "localhost", "port": 9000, "workers": 4}
 
-        file1_path = "/test/config1.json"
-        file2_path = "/test/config2.json"
+        file1_path = tmp_path / "config1.json"
+        file2_path = tmp_path / "config2.json"
 
-        self.fs.create_file(file1_path, contents=json.dumps(config1))
-        self.fs.create_file(file2_path, contents=json.dumps(config2))
+        file1_path.write_text(json.dumps(config1))
+        file2_path.write_text(json.dumps(config2))
 
-        diff = get_config_diff(file1_path, file2_path)
+        diff = get_config_diff(str(file1_path), str(file2_path))
 
-        self.assertEqual(diff["unchanged"]["host"], "localhost")
-        self.assertEqual(diff["changed"]["port"]["old"], 8000)
-        self.assertEqual(diff["changed"]["port"]["new"], 9000)
-        self.assertEqual(diff["removed"]["debug"], False)
-        self.assertEqual(diff["added"]["workers"], 4)
+        assert diff["unchanged"]["host"] == "localhost"
+        assert diff["changed"]["port"]["old"] == 8000
+        assert diff["changed"]["port"]["new"] == 9000
+        assert diff["removed"]["debug"] is False
+        assert diff["added"]["workers"] == 4
 
-    def test_get_config_diff_identical(self):
+    def test_get_config_diff_identical(self, tmp_path):
         """Test diff with identical configs."""
-        config = {"host": "localhost", "port": 8000}
+        file1_path = tmp_path / "config1.json"
+        file2_path = tmp_path / "config2.json"
 
-        file1_path = "/test/config1.json"
-        file2_path = "/test/config2.json"
+        file1_path.write_text(_CFG_BASIC)
+        file2_path.write_text(_CFG_BASIC)
 
-        self.fs.create_file(file1_path, contents=json.dumps(config))
-        self.fs.create_file(file2_path, contents=json.dumps(config))
+        diff = get_config_diff(str(file1_path), str(file2_path))
 
-        diff = get_config_diff(file1_path, file2_path)
+        assert diff["unchanged"] == _CFG_BASIC_DATA
+        assert diff["added"] == {}
+        assert diff["removed"] == {}
+        assert diff["changed"] == {}
 
-        self.assertEqual(diff["unchanged"], config)
-        self.assertEqual(diff["added"], {})
-        self.assertEqual(diff["removed"], {})
-        self.assertEqual(diff["changed"], {})
+    def test_get_config_diff_reflects_file_changes(self, tmp_path):
+        """Test that a diff reflects a file rewritten since the last call."""
+        file1_path = tmp_path / "config1.json"
+        file2_path = tmp_path / "config2.json"
 
+        file1_path.write_text(_CFG_BASIC)
+        file2_path.write_text(_CFG_BASIC)
 
-class TestApplyConfigTemplate(TestCase):
-    """Test apply_config_template function."""
+        assert get_config_diff(str(file1_path), str(file2_path))["changed"] == {}
 
-    def setUp(self):
-        """Set up test environment."""
-        self.setUpPyfakefs()
+        # Same size and same mtime as before
+        mtime_ns = file2_path.stat().st_mtime_ns
+        file2_path.write_text(json.dumps({"host": "localhost", "port": 9000}))
+        os.utime(file2_path, ns=(mtime_ns, mtime_ns))
 
-    def test_apply_config_template_success(self):
+        diff = get_config_diff(str(file1_path), str(file2_path))
+        assert diff["changed"] == {"port": {"old": 8000, "new": 9000}}
+
+
+class TestApplyConfigTemplate:
+    """Test apply_config_template function."""
+
+    def test_apply_config_template_success(self, tmp_path):
         """Test successful template application."""
         template_content = """
         {
@@ -406,27 +500,26 @@ class TestApplyConfigTemplate(TestCase):
         }
         """
 
-        template_path = "/test/template.json"
-        output_path = "/test/config.json"
+        template_path = tmp_path / "template.json"
+        output_path = tmp_path / "config.json"
 
-        self.fs.create_file(template_path, contents=template_content)
+        template_path.write_text(template_content)
 
         variables = {"HOST": "localhost", "PORT": "8000", "DEBUG": "true"}
 
         with patch("builtins.print") as mock_print:
-            apply_config_template(template_path, variables, output_path)
+            apply_config_template(str(template_path), variables, str(output_path))
 
-        self.assertTrue(os.path.exists(output_path))
+        assert output_path.exists()
 
         # Check output content
-        with open(output_path) as f:
-            config_data = json.load(f)
+        config_data = json.loads(output_path.read_text())
 
         expected = {"host": "localhost", "port": 8000, "rez_debug": True}
-        self.assertEqual(config_data, expected)
+        assert config_data == expected
         mock_print.assert_called_once()
 
-    def test_apply_config_template_invalid_json(self):
+    def test_apply_config_template_invalid_json(self, tmp_path):
         """Test template that results in invalid JSON."""
         template_content = """
         {
@@ -434,19 +527,17 @@ class TestApplyConfigTemplate(TestCase):
             "port": ${PORT}
         """  # Missing closing brace
 
-        template_path = "/test/template.json"
-        output_path = "/test/config.json"
+        template_path = tmp_path / "template.json"
+        output_path = tmp_path / "config.json"
 
-        self.fs.create_file(template_path, contents=template_content)
+        template_path.write_text(template_content)
 
         variables = {"HOST": "localhost", "PORT": "8000"}
 
-        with self.assertRaises(ValueError) as cm:
-            apply_config_template(template_path, variables, output_path)
-
-        self.assertIn("Template resulted in invalid JSON", str(cm.exception))
+        with pytest.raises(ValueError, match="Template resulted in invalid JSON"):
+            apply_config_template(str(template_path), variables, str(output_path))
 
-    def test_apply_config_template_invalid_config(self):
+    def test_apply_config_template_invalid_config(self, tmp_path):
         """Test template that results in invalid configuration."""
         template_content = """
         {
@@ -455,20 +546,18 @@ class TestApplyConfigTemplate(TestCase):
         }
         """
 
-        template_path = "/test/template.json"
-        output_path = "/test/config.json"
+        template_path = tmp_path / "template.json"
+        output_path = tmp_path / "config.json"
 
-        self.fs.create_file(template_path, contents=template_content)
+        template_path.write_text(template_content)
 
         variables = {"HOST": "localhost", "PORT": "invalid_port"}
 
-        with self.assertRaises(ValueError) as cm:
-            apply_config_template(template_path, variables, output_path)
-
-        self.assertIn("Template configuration is invalid", str(cm.exception))
+        with pytest.raises(ValueError, match="Template configuration is invalid"):
+            apply_config_template(str(template_path), variables, str(output_path))
 
 
-class TestWatchConfigChanges(TestCase):
+class TestWatchConfigChanges:
     """Test watch_config_changes decorator."""
 
     def test_watch_config_changes_decorator(self):
@@ -487,7 +576,7 @@ class TestWatchConfigChanges(TestCase):
 
             result = test_function()
 
-        self.assertEqual(result, "test_result")
+        assert result == "test_result"
         mock_config_manager.add_change_callback.assert_called_once_with(callback_func)
         mock_config_manager.remove_change_callback.assert_called_once_with(
             callback_func
@@ -507,7 +596,7 @@ class TestWatchConfigChanges(TestCase):
             def test_function():
                 raise ValueError("Test error")
 
-            with self.assertRaises(ValueError):
+            with pytest.raises(ValueError):
                 test_function()
 
         # Should still remove callback even when exception occurs
@@ -515,3 +604,52 @@ class TestWatchConfigChanges(TestCase):
         mock_config_manager.remove_change_callback.assert_called_once_with(
             callback_func
         )
+
+
+class TestWatchConfigChangesV2:
+    """Test watch_config_changes_v2 decorator."""
+
+    def test_watch_config_changes_v2_registers_once(self):
+        """Test that the callback is registered once, not per call."""
+        callback_func = Mock()
+        mock_config_manager = Mock()
+
+        with patch(
+            "rez_proxy.utils.config_utils.get_config_manager",
+            return_value=mock_config_manager,
+        ):
+
+            @watch_config_changes_v2(callback_func)
+            def test_function():
+                return "test_result"
+
+            assert test_function() == "test_result"
+            assert test_function() == "test_result"
+
+        mock_config_manager.add_change_callback.assert_called_once()
+        mock_config_manager.remove_change_callback.assert_not_called()
+
+    def test_watch_config_changes_v2_dispatches_only_during_call(self):
+        """Test that changes are only forwarded while a call is running."""
+        callback_func = Mock()
+        mock_config_manager = Mock()
+
+        with patch(
+            "rez_proxy.utils.config_utils.get_config_manager",
+            return_value=mock_config_manager,
+        ):
+            decorator = watch_config_changes_v2(callback_func)
+
+        gated_callback = mock_config_manager.add_change_callback.call_args[0][0]
+
+        @decorator
+        def test_function():
+            gated_callback("new_config")
+            raise ValueError("Test error")
+
+        gated_callback("ignored_config")
+        with pytest.raises(ValueError):
+            test_function()
+        gated_callback("ignored_config")
+
+        callback_func.assert_called_once_with("new_config")
@@ -3,10 +3,16 @@ Tests for Web environment detection functionality.
 """
 
 import os
-from unittest.mock import mock_open, patch
+import threading
+import time
+from unittest.mock import patch
 
+import pytest
+
+from rez_proxy.core import web_detector
 from rez_proxy.core.web_detector import (
     WebEnvironmentDetector,
+    _container_detection,
     clear_detection_cache,
     force_web_mode,
     get_detected_service_mode,
@@ -16,173 +22,196 @@ from rez_proxy.core.web_detector import (
 from rez_proxy.models.schemas import ServiceMode
 
 
+@pytest.fixture
+def detector():
+    """Create a fresh detector for each test."""
+    _container_detection.cache_clear()
+    yield WebEnvironmentDetector()
+    _container_detection.cache_clear()
+
+
+@pytest.fixture
+def set_env(monkeypatch):
+    """Replace the process environment for one test; restored on teardown."""
+
+    def _set_env(env):
+        for key in list(os.environ):
+            monkeypatch.delenv(key)
+        for key, value in env.items():
+            monkeypatch.setenv(key, value)
+
+    return _set_env
+
+
+def _stat_only(*existing):
+    """Build an os.stat side effect where only the given paths exist."""
+
+    def fake_stat(path, *args, **kwargs):
+        if path in existing:
+            return os.stat_result((0,) * 10)
+        raise FileNotFoundError(path)
+
+    return fake_stat
+
+
 class TestWebEnvironmentDetector:
     """Test WebEnvironmentDetector class."""
 
-    def setup_method(self):
-        """Set up test fixtures."""
-        self.detector = WebEnvironmentDetector()
-
-    def test_init(self):
+    def test_init(self, detector):
         """Test detector initialization."""
-        assert self.detector._detection_cache is None
-        assert self.detector._forced_mode is None
+        assert detector._detection_cache is None
+        assert detector._forced_mode is None
 
-    def test_force_service_mode(self):
+    def test_force_service_mode(self, detector):
         """Test manual service mode override."""
         # Test forcing web mode
-        self.detector.force_service_mode(ServiceMode.WEB)
-        assert self.detector.get_service_mode() == ServiceMode.WEB
-        assert self.detector.is_web_environment() is True
+        detector.force_service_mode(ServiceMode.WEB)
+        assert detector.get_service_mode() == ServiceMode.WEB
+        assert detector.is_web_environment() is True
 
         # Test forcing local mode
-        self.detector.force_service_mode(ServiceMode.LOCAL)
-        assert self.detector.get_service_mode() == ServiceMode.LOCAL
-        assert self.detector.is_web_environment() is False
+        detector.force_service_mode(ServiceMode.LOCAL)
+        assert detector.get_service_mode() == ServiceMode.LOCAL
+        assert detector.is_web_environment() is False
 
         # Test clearing forced mode
-        self.detector.clear_forced_mode()
-        assert self.detector._forced_mode is None
-
-    @patch.dict(os.environ, {}, clear=True)
-    def test_environment_variables_detection_clean(self):
-        """Test environment variable detection with clean environment."""
-        assert self.detector._check_environment_variables() is False
-
-    @patch.dict(os.environ, {"REZ_PROXY_WEB_MODE": "true"}, clear=True)
-    def test_environment_variables_detection_web_mode(self):
-        """Test detection with REZ_PROXY_WEB_MODE."""
-        assert self.detector._check_environment_variables() is True
-
-    @patch.dict(os.environ, {"SERVER_SOFTWARE": "nginx/1.18"}, clear=True)
-    def test_environment_variables_detection_server_software(self):
-        """Test detection with SERVER_SOFTWARE."""
-        assert self.detector._check_environment_variables() is True
-
-    @patch.dict(os.environ, {"VERCEL": "1"}, clear=True)
-    def test_environment_variables_detection_vercel(self):
-        """Test detection with Vercel environment."""
-        assert self.detector._check_environment_variables() is True
-
-    @patch.dict(os.environ, {"KUBERNETES_SERVICE_HOST": "10.0.0.1"}, clear=True)
-    def test_environment_variables_detection_kubernetes(self):
-        """Test detection with Kubernetes environment."""
-        assert self.detector._check_environment_variables() is True
-
-    @patch.dict(os.environ, {"REZ_PROXY_FORCE_LOCAL": "true"}, clear=True)
-    def test_environment_variables_force_local(self):
-        """Test forcing local mode via environment variable."""
-        # Even with web indicators, force local should override
-        with patch.dict(
-            os.environ, {"SERVER_SOFTWARE": "nginx", "REZ_PROXY_FORCE_LOCAL": "true"}
-        ):
-            assert self.detector._check_environment_variables() is False
+        detector.clear_forced_mode()
+        assert detector._forced_mode is None
+        assert detector._forced_is_web is None
+
+    @pytest.mark.parametrize(
+        ("env", "expected"),
+        [
+            ({}, False),
+            ({"REZ_PROXY_WEB_MODE": "true"}, True),
+            ({"SERVER_SOFTWARE": "nginx/1.18"}, True),
+            ({"VERCEL": "1"}, True),
+            ({"KUBERNETES_SERVICE_HOST": "10.0.0.1"}, True),
+            # Force local overrides web indicators
+            ({"SERVER_SOFTWARE": "nginx", "REZ_PROXY_FORCE_LOCAL": "true"}, False),
+        ],
+        ids=[
+            "clean",
+            "web_mode",
+            "server_software",
+            "vercel",
+            "kubernetes",
+            "force_local",
+        ],
+    )
+    def test_environment_variables_detection(self, detector, set_env, env, expected):
+        """Test environment variable detection."""
+        set_env(env)
+
+        assert detector._check_environment_variables() is expected
 
     @patch("os.getcwd")
-    def test_deployment_context_detection_web_path(self, mock_getcwd):
+    def test_deployment_context_detection_web_path(self, mock_getcwd, detector):
         """Test deployment context detection with web paths."""
         mock_getcwd.return_value = "/var/www/html"
-        assert self.detector._check_deployment_context() is True
+        assert detector._check_deployment_context() is True
 
         mock_getcwd.return_value = "/app/src"
-        assert self.detector._check_deployment_context() is True
+        assert detector._check_deployment_context() is True
 
         mock_getcwd.return_value = "/home/user/project"
-        assert self.detector._check_deployment_context() is False
+        assert detector._check_deployment_context() is False
 
     @patch("os.path.exists")
-    def test_deployment_context_detection_config_files(self, mock_exists):
+    def test_deployment_context_detection_config_files(self, mock_exists, detector):
         """Test deployment context detection with config files."""
         # Test with Dockerfile
         mock_exists.side_effect = lambda path: path == "Dockerfile"
-        assert self.detector._check_deployment_context() is True
+        assert detector._check_deployment_context() is True
 
         # Test with vercel.json
         mock_exists.side_effect = lambda path: path == "vercel.json"
-        assert self.detector._check_deployment_context() is True
+        assert detector._check_deployment_context() is True
 
         # Test with no web config files
         mock_exists.return_value = False
-        assert self.detector._check_deployment_context() is False
+        assert detector._check_deployment_context() is False
 
-    @patch.dict(os.environ, {"UWSGI_VERSION": "2.0.18"}, clear=True)
-    def test_web_server_indicators_uwsgi(self):
+    def test_web_server_indicators_uwsgi(self, detector, set_env):
         """Test web server detection with uWSGI."""
-        assert self.detector._check_web_server_indicators() is True
+        set_env({"UWSGI_VERSION": "2.0.18"})
+        assert detector._check_web_server_indicators() is True
 
-    @patch.dict(os.environ, {"GUNICORN_CMD_ARGS": "--bind 0.0.0.0:8000"}, clear=True)
-    def test_web_server_indicators_gunicorn(self):
+    def test_web_server_indicators_gunicorn(self, detector, set_env):
         """Test web server detection with Gunicorn."""
-        assert self.detector._check_web_server_indicators() is True
+        set_env({"GUNICORN_CMD_ARGS": "--bind 0.0.0.0:8000"})
+        assert detector._check_web_server_indicators() is True
 
-    @patch.dict(os.environ, {}, clear=True)
-    def test_web_server_indicators_none(self):
+    def test_web_server_indicators_none(self, detector, set_env):
         """Test web server detection with no indicators."""
-        assert self.detector._check_web_server_indicators() is False
+        set_env({})
+        assert detector._check_web_server_indicators() is False
 
-    @patch("os.path.exists")
-    def test_container_environment_detection_docker(self, mock_exists):
+    @patch("os.stat")
+    def test_container_environment_detection_docker(self, mock_stat, detector):
         """Test container environment detection with Docker."""
         # Test .dockerenv file
-        mock_exists.side_effect = lambda path: path == "/.dockerenv"
-        assert self.detector._check_container_environment() is True
+        mock_stat.side_effect = _stat_only("/.dockerenv")
+        assert detector._check_container_environment() is True
 
-    @patch("os.path.exists")
-    @patch(
-        "builtins.open",
-        new_callable=mock_open,
-        read_data="1:name=systemd:/docker/abc123",
-    )
-    def test_container_environment_detection_cgroup(self, mock_file, mock_exists):
+    @patch("os.stat", side_effect=_stat_only())
+    def test_container_environment_detection_cgroup(
+        self, mock_stat, detector, tmp_path
+    ):
         """Test container environment detection with cgroup."""
-        mock_exists.side_effect = lambda path: path == "/proc/1/cgroup"
-        assert self.detector._check_container_environment() is True
-
-    @patch("os.path.exists")
-    @patch(
-        "builtins.open", new_callable=mock_open, read_data="1:name=systemd:/init.scope"
-    )
-    def test_container_environment_detection_no_container(self, mock_file, mock_exists):
+        cgroup_path = tmp_path / "cgroup"
+        cgroup_path.write_bytes(b"1:name=systemd:/docker/abc123")
+        assert (
+            detector._check_container_environment(cgroup_path=str(cgroup_path)) is True
+        )
+
+    @patch("os.stat", side_effect=_stat_only())
+    def test_container_environment_detection_no_container(
+        self, mock_stat, detector, tmp_path
+    ):
         """Test container environment detection without container."""
-        mock_exists.side_effect = lambda path: path == "/proc/1/cgroup"
-        assert self.detector._check_container_environment() is False
-
-    @patch("os.path.exists")
-    def test_container_environment_detection_kubernetes(self, mock_exists):
+        cgroup_path = tmp_path / "cgroup"
+        cgroup_path.write_bytes(b"1:name=systemd:/init.scope")
+        assert (
+            detector._check_container_environment(cgroup_path=str(cgroup_path)) is False
+        )
+
+    @patch("os.stat")
+    def test_container_environment_detection_kubernetes(self, mock_stat, detector):
         """Test container environment detection with Kubernetes."""
-        mock_exists.side_effect = lambda path: path == "/var/run/secrets/kubernetes.io"
-        assert self.detector._check_container_environment() is True
+        mock_stat.side_effect = _stat_only("/var/run/secrets/kubernetes.io")
+        assert detector._check_container_environment() is True
 
-    def test_caching_behavior(self):
+    def test_caching_behavior(self, detector):
         """Test that detection results are cached."""
         # Mock all detection methods to return False
         with patch.object(
-            self.detector, "_detect_web_environment", return_value=False
+            detector, "_detect_web_environment", return_value=False
         ) as mock_detect:
             # First call should trigger detection
-            result1 = self.detector.is_web_environment()
+            result1 = detector.is_web_environment()
             assert result1 is False
             assert mock_detect.call_count == 1
 
             # Second call should use cache
-            result2 = self.detector.is_web_environment()
+            result2 = detector.is_web_environment()
             assert result2 is False
             assert mock_detect.call_count == 1  # No additional calls
 
-    def test_cache_clearing(self):
+    def test_cache_clearing(self, detector):
         """Test cache clearing functionality."""
         # Set up cache
-        with patch.object(self.detector, "_detect_web_environment", return_value=True):
-            self.detector.is_web_environment()
-            assert self.detector._detection_cache is True
+        with patch.object(detector, "_detect_web_environment", return_value=True):
+            detector.is_web_environment()
+            assert detector._detection_cache is True
 
         # Clear cache
-        self.detector._clear_cache()
-        assert self.detector._detection_cache is None
+        detector._clear_cache()
+        assert detector._detection_cache is None
 
-    def test_get_detection_info(self):
+    def test_get_detection_info(self, detector):
         """Test getting detailed detection information."""
-        info = self.detector.get_detection_info()
+        info = detector.get_detection_info()
 
         assert "is_web_environment" in info
         assert "service_mode" in info
@@ -212,9 +241,36 @@ class TestWebDetectorGlobalFunctions:
         detector2 = get_web_detector()
         assert detector1 is detector2
 
-    @patch.dict(os.environ, {"REZ_PROXY_WEB_MODE": "true"}, clear=True)
-    def test_is_web_environment_cached(self):
+    def test_get_web_detector_concurrent_first_call(self, monkeypatch):
+        """Test that concurrent first calls share one detector instance."""
+
+        class SlowDetector(WebEnvironmentDetector):
+            def __init__(self):
+                time.sleep(0.01)
+                super().__init__()
+
+        monkeypatch.setattr(web_detector, "WebEnvironmentDetector", SlowDetector)
+        monkeypatch.setattr(web_detector, "_web_detector", None)
+
+        barrier = threading.Barrier(4)
+        results = []
+
+        def first_call():
+            barrier.wait()
+            results.append(get_web_detector())
+
+        threads = [threading.Thread(target=first_call) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert len(results) == 4
+        assert all(result is results[0] for result in results)
+
+    def test_is_web_environment_cached(self, set_env):
         """Test cached web environment detection."""
+        set_env({"REZ_PROXY_WEB_MODE": "true"})
         # Clear cache first
         clear_detection_cache()
 
@@ -255,38 +311,37 @@ class TestWebDetectorGlobalFunctions:
 class TestWebDetectorIntegration:
     """Integration tests for web detector."""
 
-    def setup_method(self):
-        """Set up test fixtures."""
-        self.detector = WebEnvironmentDetector()
-
-    @patch.dict(
-        os.environ, {"VERCEL": "1", "VERCEL_URL": "myapp.vercel.app"}, clear=True
-    )
     @patch("os.path.exists", return_value=True)
-    def test_vercel_environment_detection(self, mock_exists):
+    def test_vercel_environment_detection(self, mock_exists, detector, set_env):
         """Test detection in Vercel environment."""
-        assert self.detector.is_web_environment() is True
-        assert self.detector.get_service_mode() == ServiceMode.WEB
+        set_env({"VERCEL": "1", "VERCEL_URL": "myapp.vercel.app"})
+        assert detector.is_web_environment() is True
+        assert detector.get_service_mode() == ServiceMode.WEB
 
-    @patch.dict(os.environ, {"KUBERNETES_SERVICE_HOST": "10.0.0.1"}, clear=True)
-    @patch("os.path.exists")
-    def test_kubernetes_environment_detection(self, mock_exists):
+    @patch("os.stat")
+    def test_kubernetes_environment_detection(self, mock_stat, detector, set_env):
         """Test detection in Kubernetes environment."""
-        mock_exists.side_effect = lambda path: path == "/var/run/secrets/kubernetes.io"
-        assert self.detector.is_web_environment() is True
-        assert self.detector.get_service_mode() == ServiceMode.WEB
+        set_env({"KUBERNETES_SERVICE_HOST": "10.0.0.1"})
+        mock_stat.side_effect = _stat_only("/var/run/secrets/kubernetes.io")
+        assert detector.is_web_environment() is True
+        assert detector.get_service_mode() == ServiceMode.WEB
 
-    @patch.dict(os.environ, {}, clear=True)
     @patch("os.getcwd", return_value="/home/user/project")
     @patch("os.path.exists", return_value=False)
-    def test_local_development_environment(self, mock_exists, mock_getcwd):
+    @patch("os.stat", side_effect=_stat_only())
+    @patch("builtins.open", side_effect=FileNotFoundError)
+    def test_local_development_environment(
+        self, mock_file, mock_stat, mock_exists, mock_getcwd, detector, set_env
+    ):
         """Test detection in local development environment."""
-        assert self.detector.is_web_environment() is False
-        assert self.detector.get_service_mode() == ServiceMode.LOCAL
+        set_env({})
+        assert detector.is_web_environment() is False
+        assert detector.get_service_mode() == ServiceMode.LOCAL
 
-    def test_mixed_indicators_priority(self):
+    def test_mixed_indicators_priority(self, detector, monkeypatch):
         """Test behavior with mixed environment indicators."""
         # Test that explicit force local overrides web indicators
-        with patch.dict(os.environ, {"VERCEL": "1", "REZ_PROXY_FORCE_LOCAL": "true"}):
-            assert self.detector._check_environment_variables() is False
-            assert self.detector.get_service_mode() == ServiceMode.LOCAL
+        monkeypatch.setenv("VERCEL", "1")
+        monkeypatch.setenv("REZ_PROXY_FORCE_LOCAL", "true")
+        assert detector._check_environment_variables() is False
+        assert detector.get_service_mode() == ServiceMode.LOCAL